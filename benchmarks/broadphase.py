@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Benchmark for the collision broadphases.
+
+Runs a game with many bouncing, colliding, balls with every available
+broadphase, and reports the time per frame. Balls are either all small
+and of the same size, or of mixed sizes. All broadphases must produce the
+same game state.
+
+Usage:
+    python -m benchmarks.broadphase [objects] [frames]
+"""
+
+import gc
+import os
+import sys
+import time
+
+import yaml
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from genesis.engine.game import Game  # noqa: E402
+from genesis.engine.broadphase import BROADPHASES  # noqa: E402
+
+SCENARIOS = {
+    "uniform": "4",
+    "mixed sizes": "{random: [2, 60], seed: 42}",
+}
+
+SCRIPT = """
+interface:
+  screen: {width: 800, height: 600}
+game:
+  collision:
+    broadphase: %(broadphase)s
+  objects:
+  - ball:
+      behaviors:
+      - Circle:
+      - LinearMove:
+      - LimitMovement:
+          limit_area: [0, 0, 800, 600]
+          events:
+          - offlimits:
+            - do: flip_vertical_movement
+      - Collider:
+          bounding_shape: circle
+          events:
+          - collision:
+            - do: angle = collision.angle
+  levels:
+  - stress:
+    - start:
+      - do:
+        - spawn:
+            object_name: ball
+            count: %(count)d
+            radius: %(radius)s
+            position:
+            - {random: [0, 740], seed: 1}
+            - {random: [0, 540], seed: 2}
+            angle: {range: [0, 360]}
+"""
+
+
+def create_script(broadphase, count, radius):
+    """Create a game script with `count` colliding balls."""
+    return yaml.safe_load(
+        SCRIPT % {"broadphase": broadphase, "count": count, "radius": radius}
+    )
+
+
+def run(broadphase, count, radius, frames):
+    """Run the game, returning the time per frame, and the final state."""
+    game = Game(create_script(broadphase, count, radius), fps=0)
+    game.load()
+    level = game.levels[0]
+    level.setup()
+    level.start()
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.step()
+    elapsed = time.perf_counter() - start
+    state = [(obj.position, obj.angle) for obj in game.find_objects("ball")]
+    return elapsed / frames, state
+
+
+def main(count=300, frames=20):
+    """Run the benchmark."""
+    for scenario, radius in SCENARIOS.items():
+        reference, expected = run("all_pairs", count, radius, frames)
+        print("%s, %d objects:" % (scenario, count))
+        for broadphase in BROADPHASES:
+            elapsed, state = run(broadphase, count, radius, frames)
+            print(
+                "  %-16s %8.2fms per frame, %5.1fx%s"
+                % (
+                    broadphase,
+                    1000 * elapsed,
+                    reference / elapsed,
+                    "" if state == expected else " (DIFFERENT RESULT)",
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Benchmark for batched evaluation of event handler guards.
+
+Compares evaluating a `when` guard for each event separately, as done
+when events are handled as they are emitted, with evaluating it for all
+events of a frame at once, as done when the game uses `batch_events`.
+Guards that are not vectorized, like `any`, are evaluated one event at a
+time in both cases, and the game does not batch their events.
+
+Usage:
+    python -m benchmarks.events [events] [repetitions]
+"""
+
+import sys
+import time
+
+from genesis.engine.interpreter import GenesisIntepreter
+
+GUARDS = [
+    "offlimits.amount * 2 - speed",
+    "any (right, left) in offlimits.limit",
+]
+
+
+class Game:
+    # pylint: disable=too-few-public-methods
+    """A game without objects, so identifiers come from event fields."""
+
+    names_version = 0
+
+    @staticmethod
+    def find_object(_name):
+        """Return no object for any name."""
+        return None
+
+
+def create_scopes(count):
+    """Create the scopes for `count` events."""
+    return [
+        {
+            "name": "offlimits",
+            "limit": ["left"],
+            "amount": index % 7,
+            "speed": 10,
+        }
+        for index in range(count)
+    ]
+
+
+def evaluate_single(interpreter, guard, scopes):
+    """Evaluate the guard for each scope, as done for a single event."""
+    compiled = interpreter.compile_expression(guard)
+    return [bool(interpreter.evaluate(compiled, s)) for s in scopes]
+
+
+def evaluate_batch(interpreter, guard, scopes):
+    """Evaluate the guard for all scopes at once."""
+    return interpreter.evaluate_condition(guard, scopes)
+
+
+def benchmark(name, function, repetitions, *args):
+    """Measure and report the time to run function, repetitions times."""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        function(*args)
+    elapsed = time.perf_counter() - start
+    print("%-40s %8.3fms per frame" % (name, 1000 * elapsed / repetitions))
+    return elapsed
+
+
+def main(count=1000, repetitions=100):
+    """Run the benchmark."""
+    interpreter = GenesisIntepreter(Game())
+    scopes = create_scopes(count)
+    for guard in GUARDS:
+        args = (interpreter, guard, scopes)
+        single = benchmark(
+            "%s (single)" % guard, evaluate_single, repetitions, *args
+        )
+        batch = benchmark(
+            "%s (batch)" % guard, evaluate_batch, repetitions, *args
+        )
+        print("speedup: %.1fx" % (single / batch))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Micro-benchmark for the Genesis language lexer.
+
+Compares the number of tokens per second produced by the Genesis lexer
+with the Python `tokenize` module, for typical Genesis statements.
+
+Usage:
+    python -m benchmarks.lexer [repetitions]
+"""
+
+import sys
+import time
+import tokenize
+from io import StringIO
+
+from genesis.engine import lexer
+
+SOURCES = [
+    "angle = collision.angle",
+    "any (right, left) in offlimits.limit",
+    "all [top, bottom] in offlimits.limit",
+    "screen.width-25*2",
+    "speed += 2 ** 3 // (4 % 3)",
+    "flip_horizontal_movement",
+]
+
+
+def python_tokenize(source):
+    """Tokenize source with the Python `tokenize` module."""
+    with StringIO(source) as stream:
+        return list(tokenize.generate_tokens(stream.readline))
+
+
+def benchmark(name, function, repetitions):
+    """
+    Measure and report the tokens per second produced by function.
+
+    Python `tokenize` also produces NEWLINE and ENDMARKER tokens, so the
+    number of sources tokenized per second is also reported.
+    """
+    count = 0
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        for source in SOURCES:
+            count += len(function(source))
+    elapsed = time.perf_counter() - start
+    print(
+        "%-16s %10d tokens in %.3fs: %12.0f tokens/s, %10.0f sources/s"
+        % (
+            name,
+            count,
+            elapsed,
+            count / elapsed,
+            repetitions * len(SOURCES) / elapsed,
+        )
+    )
+    return count / elapsed
+
+
+def main(repetitions=20000):
+    """Run the benchmark."""
+    start = time.perf_counter()
+    benchmark("genesis lexer", lexer.tokenize, repetitions)
+    genesis_time = time.perf_counter() - start
+    start = time.perf_counter()
+    benchmark("python tokenize", python_tokenize, repetitions)
+    python_time = time.perf_counter() - start
+    print("speedup: %.1fx" % (python_time / genesis_time))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
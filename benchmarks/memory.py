@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Benchmark for the memory used by game objects.
+
+Compares the memory used by objects of the class created for an object
+template, which stores the behavior fields in slots, with objects of a
+class with the same behaviors, that stores them in a `__dict__`.
+
+Usage:
+    python -m benchmarks.memory [objects...]
+"""
+
+import os
+import sys
+import tracemalloc
+
+from genesis.objects import GameObject, create_object_class
+from genesis.behavior import Circle, LinearMove, LimitMovement, Collider
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from genesis.engine.game import Game  # noqa: E402
+
+BEHAVIORS = (GameObject, Circle, LinearMove, LimitMovement, Collider)
+
+PARAMETERS = {
+    "name": "ball",
+    "position": [300, 200],
+    "radius": 5,
+    "speed": 10,
+    "angle": 45,
+    "limit_area": [0, 0, 600, 400],
+    "bounding_shape": "circle",
+}
+
+
+def measure(object_class, game, count):
+    """Measure the memory used by `count` objects of object_class."""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [object_class(game=game, **PARAMETERS) for _ in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return end - start
+
+
+def unslotted_namespace(object_class):
+    """Retrieve the namespace of object_class, without its slots."""
+    slots = ("__slots__",) + object_class.__slots__
+    return {
+        key: value
+        for key, value in vars(object_class).items()
+        if key not in slots
+    }
+
+
+def main(*counts):
+    """Run the benchmark."""
+    game = Game({}, fps=0)
+    slotted = create_object_class("ball", BEHAVIORS)
+    unslotted = type("ball", slotted.__bases__, unslotted_namespace(slotted))
+    for count in counts or (10000, 100000):
+        with_slots = measure(slotted, game, count)
+        with_dict = measure(unslotted, game, count)
+        print(
+            "%7d objects: %6.0f bytes/object with slots, "
+            "%6.0f bytes/object with __dict__ (%.0f%% less)"
+            % (
+                count,
+                with_slots / count,
+                with_dict / count,
+                100 * (1 - with_slots / with_dict),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
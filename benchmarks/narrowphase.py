@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Benchmark for the collision narrowphase.
+
+Measures the time to test the collision between two objects, for each
+pair of shapes, both for objects that overlap, and for objects that are
+far apart, which are rejected by their bounding boxes. The time includes
+selecting the collision test for the pair of shapes, and querying the
+objects bounds.
+
+Also measures the time to test many pairs of circles at once, with
+`Collider.detect_collisions()`, in a batch, if NumPy is available, and
+one pair at a time.
+
+Usage:
+    python -m benchmarks.narrowphase [tests] [circles]
+"""
+
+import random
+import sys
+import timeit
+from itertools import combinations
+
+from genesis.objects import GameObject, create_object_class
+from genesis.behavior import Collider
+
+SHAPES = Collider.SHAPES
+
+POSITIONS = {"hit": ((100, 100), (108, 104)), "miss": ((100, 100), (300, 300))}
+
+
+class Shape:
+    """The geometry of all shapes, centered at the object position."""
+
+    # pylint: disable=assigning-non-slot, too-few-public-methods
+    __slots__ = ()
+    _fields = ("center", "radius", "dimension", "rotation", "rect", "line")
+
+    def __init__(self, **options):
+        """Initialize the shape geometry."""
+        x, y = options["position"]  # pylint: disable=invalid-name
+        size = options.get("size", 20)
+        self.center = (x, y)
+        self.radius = size / 2
+        self.dimension = (size, size / 2)
+        self.rotation = 30
+        self.rect = (x - size / 2, y - size / 2, size, size)
+        self.line = (
+            (x - size / 2, y - size / 4),
+            (x + size / 2, y + size / 4),
+        )
+
+
+def measure(first, second, count):
+    """Measure the time, in nanoseconds, of a collision test."""
+    timer = timeit.Timer(lambda: first.did_collide(second))
+    return min(timer.repeat(repeat=5, number=count)) * 1e9 / count
+
+
+def measure_batch(shape_class, circles):
+    """Measure the time, in milliseconds, to test all pairs of circles."""
+    rand = random.Random(42)
+    objects = [
+        shape_class(
+            name="circle",
+            game=None,
+            position=(rand.uniform(0, 800), rand.uniform(0, 600)),
+            size=rand.uniform(10, 60),
+            bounding_shape=Collider.CIRCLE,
+        )
+        for _ in range(circles)
+    ]
+    pairs = list(combinations(objects, 2))
+    timer = timeit.Timer(lambda: Collider.detect_collisions(pairs))
+    min_batch = Collider.MIN_BATCH
+    batch = min(timer.repeat(repeat=5, number=1))
+    Collider.MIN_BATCH = len(pairs) + 1
+    single = min(timer.repeat(repeat=5, number=1))
+    Collider.MIN_BATCH = min_batch
+    print(
+        "%d pairs of circles: %.2fms in a batch, %.2fms one at a time"
+        % (len(pairs), 1000 * batch, 1000 * single)
+    )
+
+
+def main(count=20000, circles=300):
+    """Run the benchmark."""
+    shape_class = create_object_class("shape", (GameObject, Shape, Collider))
+    for first_shape in SHAPES:
+        for second_shape in SHAPES:
+            results = []
+            for case, (first_at, second_at) in POSITIONS.items():
+                first = shape_class(
+                    name="first",
+                    game=None,
+                    position=first_at,
+                    bounding_shape=first_shape,
+                )
+                second = shape_class(
+                    name="second",
+                    game=None,
+                    position=second_at,
+                    bounding_shape=second_shape,
+                )
+                elapsed = measure(first, second, count)
+                results.append("%s: %6.0fns" % (case, elapsed))
+            print(
+                "%-8s %-8s %s"
+                % (first_shape, second_shape, ", ".join(results))
+            )
+    measure_batch(shape_class, circles)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Benchmark for spawning game objects.
+
+Compares the number of objects spawned per second by `Game.spawn`, which
+reuses the class created for the object template when the script is
+loaded, with creating a new class for every spawned object, as done by
+previous versions of Genesis. Also compares spawning objects with one
+`spawn` action for each object, with a single `spawn` action with a
+`count`.
+
+Usage:
+    python -m benchmarks.spawn [objects]
+"""
+
+import gc
+import os
+import sys
+import copy
+import time
+
+from genesis.objects import create_object_class
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from genesis.engine.game import Game  # noqa: E402
+
+SCRIPT = {
+    "interface": {"screen": {"width": 600, "height": 400}},
+    "game": {
+        "objects": [
+            {
+                "ball": {
+                    "behaviors": [
+                        {"Circle": {"radius": 5}},
+                        {"LinearMove": None},
+                        {
+                            "LimitMovement": {
+                                "limit_area": [0, 0, 600, 400],
+                                "events": [
+                                    {
+                                        "offlimits": [
+                                            {"do": "flip_vertical_movement"}
+                                        ]
+                                    }
+                                ],
+                            }
+                        },
+                        {"Collider": {"bounding_shape": "circle"}},
+                    ]
+                }
+            }
+        ],
+    },
+}
+
+PARAMETERS = {"position": [300, 200], "speed": 10, "angle": 45}
+
+
+def create_game():
+    """Create a game, with its script loaded."""
+    # loading a script modifies it, so a copy is used for each game.
+    game = Game(copy.deepcopy(SCRIPT), fps=0)
+    game.load()
+    return game
+
+
+def spawn_cached(game, count):
+    """Spawn objects with `Game.spawn`."""
+    for _ in range(count):
+        game.spawn("ball", **PARAMETERS)
+
+
+def spawn_new_class(game, count):
+    """Spawn objects creating a new class for each one."""
+    template = type(game.find_object("ball"))
+    behaviors = template.__bases__
+    for _ in range(count):
+        object_class = create_object_class("ball", behaviors)
+        game.add_object(object_class(name="ball", game=game, **PARAMETERS))
+
+
+def spawn_actions(game, count):
+    """Spawn objects with one `spawn` action for each object."""
+    for _ in range(count):
+        game.interpreter.execute(
+            "spawn", caller=game, object_name="ball", **PARAMETERS
+        )
+
+
+def spawn_bulk(game, count):
+    """Spawn objects with a single `spawn` action, with a `count`."""
+    game.interpreter.execute(
+        "spawn", caller=game, object_name="ball", count=count, **PARAMETERS
+    )
+
+
+def benchmark(name, function, count):
+    """Measure and report the objects spawned per second by function."""
+    game = create_game()
+    game.spawn("ball", **PARAMETERS)
+    # objects of previous runs should not be collected during this one.
+    gc.collect()
+    start = time.perf_counter()
+    function(game, count)
+    elapsed = time.perf_counter() - start
+    print(
+        "%-24s %8d objects in %.3fs: %10.0f objects/s"
+        % (name, count, elapsed, count / elapsed)
+    )
+    return elapsed
+
+
+def main(count=10000):
+    """Run the benchmark."""
+    cached = benchmark("class per template", spawn_cached, count)
+    new_class = benchmark("class per object", spawn_new_class, count)
+    print("speedup: %.1fx" % (new_class / cached))
+    actions = benchmark("one action per object", spawn_actions, count)
+    bulk = benchmark("single action", spawn_bulk, count)
+    print("speedup: %.1fx" % (actions / bulk))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
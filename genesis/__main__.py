@@ -25,6 +25,7 @@ import logging
 import yaml
 
 import genesis
+from genesis.errors import ScriptError
 from genesis.engine.game import Game
 
 
@@ -45,6 +46,11 @@ cmdparser.add_argument(
     default=30,
     help="Maximum number of cycles per second of the game loop.",
 )
+cmdparser.add_argument(
+    "--batch-events",
+    action="store_true",
+    help="Handle events of objects of the same type in batches.",
+)
 cmdparser.add_argument(
     "--replit",
     action="store_true",
@@ -78,6 +84,10 @@ if options.replit:
 with open(options.script[0], "r") as stream:
     script = yaml.safe_load(stream)
 
-game = Game(script, fps=FPS)
+game = Game(script, fps=FPS, batch_events=options.batch_events)
 log.info("\n".join(game.game_info()))
-game.run()
+try:
+    game.run()
+except ScriptError as error:
+    log.critical(str(error))
+    sys.exit(1)
@@ -20,17 +20,51 @@
 """Basic behaviors."""
 
 
+class CacheCounters:
+    """
+    Count how often a cached value is reused, or computed again.
+
+    Behaviors caching derived values, like the object position, or its
+    bounds, share a counter for all objects, with the number of `hits`,
+    when the cached value was reused, and `misses`, when it was computed.
+    """
+
+    def __init__(self):
+        """Initialize the counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Reset the counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Retrieve the counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
 class Drawable:
     """Abstract class for drawable objects."""
 
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__color", "__z_index")
+
     def __init__(self, **options):
         """Initialize object."""
         self.__color = options.get("color", (255, 255, 255))
+        self.__z_index = options.get("z_index", 0)
 
     def draw(self, screen):
         """Draw the object to the given screen."""
         raise NotImplementedError("Not implemented: `draw()`")
 
+    @property
+    def z_index(self):
+        """Retrieve the object drawing order, lower values are drawn first."""
+        return self.__z_index
+
     @property
     def fg_color(self):
         """Retrieve object position."""
@@ -20,281 +20,926 @@
 """Collision objects and algorithms."""
 
 import logging
-from math import sin, cos, atan2, copysign, radians, degrees
+from heapq import merge
+from types import MappingProxyType
+from math import sin, cos, atan2, copysign, radians, degrees, hypot, pi
 
 from genesis.engine.events import GameEvent
+from genesis.engine.broadphase import ALL_LAYERS
+from genesis.behavior.basic import CacheCounters
+from genesis.objects import runs_after
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # pylint: disable=invalid-name
 
 
 logger = logging.getLogger("genesis_gsd")
 
+# Shape kinds, the index of each shape name in `Collider.SHAPES`.
+_ELLIPSE, _RECT, _CIRCLE, _LINE, _POINT = range(5)
+
+# Result of a collision test, for objects that do not collide.
+_MISS = (False, 0, 0)
+
+# Distance under which a point is considered to be on a line, or a point.
+_EPSILON = 1e-6
+
+# Contacts of objects without contacts, shared, to save memory.
+_NO_CONTACTS = MappingProxyType({})
+
+
+def _ellipse_bounds(obj, bounds):
+    """
+    Write the bounds of an ellipse to a buffer.
+
+    The sine and cosine of the rotation are cached in the buffer, and are
+    only computed again if the rotation changes.
+    """
+    bounds[0], bounds[1] = obj.center
+    bounds[2], bounds[3] = obj.dimension
+    rotation = obj.rotation
+    if rotation != bounds[4]:
+        bounds[4] = rotation
+        bounds[5] = sin(radians(rotation))
+        bounds[6] = cos(radians(rotation))
+
+
+def _rect_bounds(obj, bounds):
+    """Write the bounds of a rectangle to a buffer."""
+    bounds[0], bounds[1], bounds[2], bounds[3] = obj.rect
+
+
+def _circle_bounds(obj, bounds):
+    """Write the bounds of a circle to a buffer."""
+    bounds[0], bounds[1] = obj.center
+    bounds[2] = obj.radius
+
+
+def _line_bounds(obj, bounds):
+    """Write the bounds of a line segment to a buffer."""
+    (bounds[0], bounds[1]), (bounds[2], bounds[3]) = obj.line
+
+
+def _point_bounds(obj, bounds):
+    """Write the bounds of a point to a buffer."""
+    bounds[0], bounds[1] = obj.center
+
+
+def _ellipse_extent(ellipse):
+    """Retrieve half the width and height of the box containing an ellipse."""
+    _, _, width, height, _, sin_a, cos_a = ellipse
+    return (
+        hypot(width * cos_a, height * sin_a) / 2,
+        hypot(width * sin_a, height * cos_a) / 2,
+    )
+
+
+def _ellipse_box(ellipse):
+    """Retrieve the axis aligned box containing an ellipse."""
+    x, y = ellipse[0], ellipse[1]  # pylint: disable=invalid-name
+    half_width, half_height = _ellipse_extent(ellipse)
+    return (x - half_width, y - half_height, x + half_width, y + half_height)
+
+
+def _rect_box(rect):
+    """Retrieve the axis aligned box containing a rectangle."""
+    x, y, width, height = rect  # pylint: disable=invalid-name
+    return (x, y, x + width, y + height)
+
+
+def _circle_box(circle):
+    """Retrieve the axis aligned box containing a circle."""
+    x, y, radius = circle  # pylint: disable=invalid-name
+    return (x - radius, y - radius, x + radius, y + radius)
+
+
+def _line_box(line):
+    """Retrieve the axis aligned box containing a line segment."""
+    x1, y1, x2, y2 = line  # pylint: disable=invalid-name
+    return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+
+def _point_box(point):
+    """Retrieve the axis aligned box containing a point."""
+    x, y = point  # pylint: disable=invalid-name
+    return (x, y, x, y)
+
+
+def _closest_on_ellipse(a, b, x, y):
+    """
+    Retrieve the point of an ellipse boundary closest to a point.
+
+    The ellipse is centered at the origin, with semi-axes `a` and `b`
+    aligned to the axes, and the point must be outside the ellipse. The
+    point is found iteratively, approximating the ellipse by circles of
+    its evolute, which converges in a few iterations.
+    """
+    # pylint: disable=invalid-name
+    abs_x, abs_y = abs(x), abs(y)
+    tx = ty = 0.7071067811865476
+    for _ in range(4):
+        ex = (a * a - b * b) * tx**3 / a
+        ey = (b * b - a * a) * ty**3 / b
+        qx, qy = abs_x - ex, abs_y - ey
+        q = hypot(qx, qy)
+        if q == 0:
+            break
+        r = hypot(a * tx - ex, b * ty - ey)
+        tx = min(1.0, max(0.0, (qx * r / q + ex) / a))
+        ty = min(1.0, max(0.0, (qy * r / q + ey) / b))
+        t = hypot(tx, ty)
+        if t == 0:
+            break
+        tx, ty = tx / t, ty / t
+    return (copysign(a * tx, x), copysign(b * ty, y))
+
+
+def _ellipse_segment(ellipse, x1, y1, x2, y2):
+    """
+    Test if a line segment intersects an ellipse.
+
+    Returns the parameter, from 0 at `(x1, y1)` to 1 at `(x2, y2)`, of the
+    segment point closest to the ellipse center, if the segment intersects
+    the ellipse, or -1 otherwise. The segment is tested in the frame where
+    the ellipse is a circle of unit radius, which preserves the parameter.
+    """
+    # pylint: disable=invalid-name,too-many-locals
+    x, y, width, height, _, sin_a, cos_a = ellipse
+    a, b = width / 2, height / 2
+    u1 = ((x1 - x) * cos_a + (y1 - y) * sin_a) / a
+    v1 = ((y1 - y) * cos_a - (x1 - x) * sin_a) / b
+    du = ((x2 - x) * cos_a + (y2 - y) * sin_a) / a - u1
+    dv = ((y2 - y) * cos_a - (x2 - x) * sin_a) / b - v1
+    length = du * du + dv * dv
+    t = 0.0
+    if length > 0:
+        t = min(1.0, max(0.0, -(u1 * du + v1 * dv) / length))
+    u, v = u1 + t * du, v1 + t * dv
+    return t if u * u + v * v <= 1 else -1.0
+
+
+def _closest_on_segment(line, x, y):
+    """Retrieve the point of a line segment closest to a point."""
+    x1, y1, x2, y2 = line  # pylint: disable=invalid-name
+    delta_x, delta_y = x2 - x1, y2 - y1
+    length = delta_x * delta_x + delta_y * delta_y
+    if length == 0:
+        return (x1, y1)
+    param = ((x - x1) * delta_x + (y - y1) * delta_y) / length
+    param = min(1.0, max(0.0, param))
+    return (x1 + param * delta_x, y1 + param * delta_y)
+
+
+def _clip_segment(origin, delta, low, high, span):
+    """
+    Clip the parameter range of a line segment to a range in one axis.
+
+    The segment coordinate in the axis, for a parameter `t`, is `origin +
+    t * delta`, and `span` is the current parameter range, `(start, end)`.
+    Returns the clipped range, which is empty, with `start > end`, if the
+    segment does not cross the axis range.
+    """
+    start, end = span
+    if delta == 0:
+        if origin < low or origin > high:
+            return (1.0, 0.0)
+        return span
+    enter, leave = (low - origin) / delta, (high - origin) / delta
+    if enter > leave:
+        enter, leave = leave, enter
+    return (max(start, enter), min(end, leave))
+
+
+def _dispatch_table(shapes, functions):
+    """Index the collision functions by the kinds of both shapes."""
+    return tuple(
+        tuple(functions.get("%s_%s" % (first, second)) for second in shapes)
+        for first in shapes
+    )
+
 
 class Collider:
-    """Encapsulates all collision detect methods."""
+    """
+    Encapsulates all collision detect methods.
+
+    Colliders keep the set of objects they were in contact with in the
+    last frame, and emit, for each colliding object:
+
+        - `collision_enter`: on the first frame of the contact;
+        - `collision_stay`: on the following frames of the contact;
+        - `collision_exit`: on the first frame without the contact;
+        - `collision`: on every frame of the contact.
+
+    All events, but `collision_exit`, have the attributes `point` and
+    `angle`, and all events have the attribute `against`, with the name
+    of the other object.
+
+    Events are only created if the object has observers for them, so
+    contacts are cheap for objects without collision handlers.
+    """
 
     # pylint: disable=no-member
     # disabling `no-member` due to the use of lazy binding for GameObject.
 
+    # pylint: disable=assigning-non-slot, too-many-instance-attributes
+    __slots__ = ()
+    _fields = (
+        "__bounding_shape",
+        "should_collide",
+        "__contacts",
+        "__touching",
+        "__shape_kind",
+        "__bounds",
+        "__box",
+        "__layer",
+        "__mask",
+        "__static",
+    )
+
     ELLIPSE = "ellipse"
     RECT = "rect"
     CIRCLE = "circle"
     LINE = "line"
     POINT = "point"
 
+    SHAPES = (ELLIPSE, RECT, CIRCLE, LINE, POINT)
+
+    # Minimum number of pairs of circles tested in a batch, with NumPy.
+    MIN_BATCH = 32
+
+    # Number of times the bounds, or the bounding box, were reused.
+    bounds_cache = CacheCounters()
+
+    # Initial bounds, and functions to write them, and to retrieve the box
+    # containing them, for each shape kind.
+    __initial_bounds = (
+        (0, 0, 0, 0, 0, 0.0, 1.0),
+        (0,) * 4,
+        (0,) * 3,
+        (0,) * 4,
+        (0,) * 2,
+    )
+    __bounds_of = (
+        _ellipse_bounds,
+        _rect_bounds,
+        _circle_bounds,
+        _line_bounds,
+        _point_bounds,
+    )
+    __box_of = (_ellipse_box, _rect_box, _circle_box, _line_box, _point_box)
+
     def __init__(self, **options):
         """Initialize the collision detection algorithms."""
-        self.__bounding_shape = options.get("bounding_shape", "circle")
+        shape = options.get("bounding_shape", "circle")
+        if shape not in Collider.SHAPES:
+            raise Exception("Invalid object bounding shape: `%s`" % shape)
+        self.__bounding_shape = shape
+        self.__shape_kind = Collider.SHAPES.index(shape)
+        self.__bounds = list(Collider.__initial_bounds[self.__shape_kind])
+        self.__box = None
         self.should_collide = options.get("should_collide", True)
-        self.run_after(self.update, self.check_collisions)
+        self.__layer = Collider.__layer_bits(options.get("layer", 1))
+        self.__mask = Collider.__layer_bits(options.get("mask", ALL_LAYERS))
+        self.__static = bool(options.get("static", False))
+        self.__contacts = _NO_CONTACTS
+        self.__touching = _NO_CONTACTS
 
     @property
     def bounding_shape(self):
         """Retrieve the object bounding shape."""
         return self.__bounding_shape
 
+    @property
+    def static(self):
+        """
+        Check if the object is static, given by the `static` option.
+
+        Static objects, like walls, are not expected to move. They are
+        kept in an index built when the level is set up, and are only
+        tested for collision against objects that are not static. If a
+        static object is moved, the game must be notified, with
+        `Game.move_static()`.
+        """
+        return self.__static
+
+    @property
+    def layer(self):
+        """
+        Retrieve the bits of the collision layers of the object.
+
+        Objects are in the layer 1, unless the `layer` option is given.
+        """
+        return self.__layer
+
+    @property
+    def mask(self):
+        """
+        Retrieve the bits of the collision layers the object collides with.
+
+        Two objects are tested for collision only if the layer of each
+        object has a bit in common with the mask of the other one. Objects
+        collide with all layers, unless the `mask` option is given.
+        """
+        return self.__mask
+
+    @staticmethod
+    def __layer_bits(value):
+        """Validate the bits of a collision layer, or mask."""
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise Exception("Invalid collision layer bits: `%s`" % value)
+        return value
+
+    @property
+    def shape_kind(self):
+        """Retrieve the kind of the bounding shape, its index in `SHAPES`."""
+        return self.__shape_kind
+
     @property
     def bounds(self):
-        """Query object bounds."""
+        """
+        Query object bounds.
+
+        The bounds depend on the object bounding shape:
+
+            - circle: `(center_x, center_y, radius)`;
+            - rect: `(x, y, width, height)`;
+            - ellipse: `(center_x, center_y, width, height, rotation,
+              sine, cosine)`, with the rotation in degrees, and its sine
+              and cosine;
+            - line: `(x1, y1, x2, y2)`;
+            - point: `(x, y)`.
+
+        The bounds are written to a list owned by the object, which is
+        reused, and only overwritten if the object geometry changed since
+        the bounds were last queried, as notified by `geometry_changed()`.
+        """
+        if self.__box is None:
+            self.__update_bounds()
+        else:
+            Collider.bounds_cache.hits += 1
+        return self.__bounds
+
+    @property
+    def bounding_box(self):
+        """
+        Query the axis aligned box containing the object bounds.
+
+        The box is a tuple `(min_x, min_y, max_x, max_y)`, cached until the
+        object geometry changes.
+        """
+        if self.__box is None:
+            self.__update_bounds()
+        else:
+            Collider.bounds_cache.hits += 1
+        return self.__box
+
+    def __update_bounds(self):
+        """Write the object bounds, and the box containing them."""
+        Collider.bounds_cache.misses += 1
         # pylint: disable=no-member
-        # Objects using collision will define these properties, if needed.
-        if self.bounding_shape == Collider.CIRCLE:
-            return (*self.center, self.radius)
-        if self.bounding_shape == Collider.RECT:
-            return self.rect
-        if self.bounding_shape == Collider.ELLIPSE:
-            return (*self.center, *self.dimension, self.rotation)
-        raise Exception("Invalid object bounding shape.")
-        # case = {
-        #     Collider.ELLIPSE: [*self.center, *self.dimension, self.rotation],
-        #       # TODO: angledrect collision
-        #     Collider.RECT: self.rect if hasattr(rect) or None,
-        #     Collider.CIRCLE: [*self.center, self.radius],
-        # }
-        # return case[self.bounding_shape]
+        # Objects using collision will define these properties.
+        Collider.__bounds_of[self.__shape_kind](self, self.__bounds)
+        self.__box = Collider.__box_of[self.__shape_kind](self.__bounds)
+
+    @runs_after("geometry_changed")
+    def __discard_bounds(self):
+        """Discard the cached bounds, after the object geometry changes."""
+        self.__box = None
 
     def did_collide(self, obj):
         """Return true if collides with object."""
         result = False
-        if all([self.should_collide, obj.should_collide]):
-            shape = "%s_%s" % (self.bounding_shape, obj.bounding_shape)
-            method = Collider.__functions.get(
-                shape, lambda a, b: (False, 0, 0)
-            )
-            result = method(self.bounds, obj.bounds)
+        if self.should_collide and obj.should_collide:
+            method = Collider.__dispatch[self.__shape_kind][obj.shape_kind]
+            if method is None:
+                result = (False, 0, 0)
+            else:
+                result = method(self.bounds, obj.bounds)
         return result
 
-    def check_collisions(self):
-        """Check collision event."""
-        for obj in self.game.game_objects:
-            if (self is not obj) and hasattr(obj, "should_collide"):
-                if self.should_collide or obj.should_collide:
-                    shape_fn = "%s_%s" % (
-                        self.bounding_shape,
-                        obj.bounding_shape,
+    def make_contact(self, obj, point, angle):
+        """
+        Register a contact with another object, emitting collision events.
+
+        The contact `point` and the `angle`, in radians, are the ones
+        returned by the collision tests.
+        """
+        logger.debug(msg="Collision: {}:{}".format(self.name, obj.name))
+        angle = 360 - ((360 + degrees(angle)) % 360.0)
+        self.__touch(obj, point, angle)
+        # pylint: disable=protected-access
+        obj.__touch(self, point, angle + 180)
+
+    @staticmethod
+    def detect_collisions(pairs):
+        """
+        Test the collisions of many pairs of colliders.
+
+        Returns a list of the colliding pairs, in the order of `pairs`, as
+        tuples `(obj, other, point, angle)`, to be registered with
+        `make_contact()`. As all pairs are tested before any contact is
+        registered, event handlers do not change the result of the tests.
+
+        If NumPy is available, and there are, at least, `MIN_BATCH` pairs
+        of circles, the circles are tested at once.
+        """
+        batch, remaining = [], range(len(pairs))
+        if numpy is not None:
+            batch, remaining = Collider.__collide_circles(pairs)
+        collisions = []
+        dispatch = Collider.__dispatch
+        for index in remaining:
+            obj, other = pairs[index]
+            func = dispatch[obj.shape_kind][other.shape_kind]
+            hit, point, angle = func(obj.bounds, other.bounds)
+            if hit:
+                collisions.append((index, obj, other, point, angle))
+        if batch:
+            collisions = merge(collisions, batch)
+        return [collision[1:] for collision in collisions]
+
+    @staticmethod
+    def __collide_circles(pairs):
+        """
+        Test the collision of all pairs of circles, with NumPy.
+
+        The tests are the same of `circle_circle`. Returns the collisions,
+        as tuples `(index, obj, other, point, angle)`, ordered by the index
+        of the pair, and the indices of the pairs that were not tested. If
+        there are not enough pairs of circles, no pair is tested.
+        """
+        # pylint: disable=too-many-locals
+        if not pairs or len(pairs) < Collider.MIN_BATCH:
+            return [], range(len(pairs))
+        # pairs of indices of the objects, in `objects`.
+        firsts, seconds = zip(*pairs)
+        objects = list(dict.fromkeys(firsts + seconds))
+        rows = {obj: row for row, obj in enumerate(objects)}
+        first_rows = numpy.fromiter(map(rows.__getitem__, firsts), dtype=int)
+        second_rows = numpy.fromiter(map(rows.__getitem__, seconds), int)
+        circles = [obj.shape_kind == _CIRCLE for obj in objects]
+        is_circle = numpy.array(circles)
+        is_circle = is_circle[first_rows] & is_circle[second_rows]
+        indices = numpy.flatnonzero(is_circle)
+        if len(indices) < max(Collider.MIN_BATCH, 1):
+            return [], range(len(pairs))
+        bounds = numpy.array(
+            [
+                obj.bounds if circle else (0, 0, 0)
+                for obj, circle in zip(objects, circles)
+            ],
+            dtype=float,
+        )
+        first = bounds[first_rows[indices]]
+        second = bounds[second_rows[indices]]
+        delta_x = second[:, 0] - first[:, 0]
+        delta_y = second[:, 1] - first[:, 1]
+        reach = first[:, 2] + second[:, 2]
+        hits = numpy.flatnonzero(
+            (numpy.abs(delta_x) <= reach)
+            & (numpy.abs(delta_y) <= reach)
+            & (delta_x**2 + delta_y**2 <= reach**2)
+        )
+        points_x = (first[hits, 0] + delta_x[hits] / 2).tolist()
+        points_y = (first[hits, 1] + delta_y[hits] / 2).tolist()
+        angles = numpy.arctan2(delta_x[hits], delta_y[hits]).tolist()
+        collisions = []
+        for index, point_x, point_y, angle in zip(
+            indices[hits].tolist(), points_x, points_y, angles
+        ):
+            obj, other = pairs[index]
+            collisions.append((index, obj, other, (point_x, point_y), angle))
+        return collisions, numpy.flatnonzero(~is_circle).tolist()
+
+    def update_contacts(self):
+        """
+        Finish the contacts of the frame.
+
+        Emit `collision_exit` for objects that were in contact with this
+        object in the last frame, but not on this one. Must be called once
+        per frame, after all collisions are tested.
+        """
+        if not self.__contacts and not self.__touching:
+            return
+        if self.has_observers("collision_exit"):
+            for obj in self.__contacts:
+                if obj not in self.__touching:
+                    self.emit(
+                        GameEvent(
+                            self, name="collision_exit", against=[obj.name]
+                        )
+                    )
+        self.__contacts = self.__touching
+        self.__touching = _NO_CONTACTS
+
+    def end_contacts(self):
+        """
+        End all contacts of the object, as it is removed from the game.
+
+        Objects in contact with this object forget it, and emit
+        `collision_exit`, as if the objects had moved apart. This object
+        does not emit `collision_exit`, as it is no longer in the game.
+        """
+        for obj in self.__contacts:
+            obj.__forget(self)  # pylint: disable=protected-access
+        for obj in self.__touching:
+            obj.__forget(self)  # pylint: disable=protected-access
+        self.__contacts = _NO_CONTACTS
+        self.__touching = _NO_CONTACTS
+
+    def __forget(self, obj):
+        """Remove the contact with an object, emitting `collision_exit`."""
+        in_contact = False
+        if obj in self.__contacts:
+            del self.__contacts[obj]
+            in_contact = True
+        if obj in self.__touching:
+            del self.__touching[obj]
+            in_contact = True
+        if in_contact and self.has_observers("collision_exit"):
+            self.emit(
+                GameEvent(self, name="collision_exit", against=[obj.name])
+            )
+
+    def __touch(self, obj, point, angle):
+        """
+        Register a contact with an object, and emit its events.
+
+        Events are only created if the object has observers for them.
+        """
+        if self.__touching is _NO_CONTACTS:
+            self.__touching = {}
+        self.__touching[obj] = None
+        if obj in self.__contacts:
+            names = ("collision", "collision_stay")
+        else:
+            names = ("collision", "collision_enter")
+        for name in names:
+            if self.has_observers(name):
+                self.emit(
+                    GameEvent(
+                        self,
+                        name=name,
+                        point=point,
+                        angle=angle,
+                        against=[obj.name],
                     )
-                    func = Collider.__functions.get(shape_fn, None)
-                    if func:
-                        collision, point, angle = func(self.bounds, obj.bounds)
-                        if collision:
-                            logger.debug(
-                                msg="Collision: {}:{}".format(
-                                    self.name, obj.name
-                                )
-                            )
-                            angle = 360 - ((360 + degrees(angle)) % 360.0)
-                            event_data = {"point": point, "angle": angle}
-                            event = GameEvent(
-                                self,
-                                name="collision",
-                                against=[obj.name],
-                                **event_data,
-                            )
-                            self.emit(event)
-                            event_data = {"point": point, "angle": angle + 180}
-                            event = GameEvent(
-                                obj,
-                                name="collision",
-                                against=[self.name],
-                                **event_data,
-                            )
-                            obj.emit(event)
+                )
 
     class __Algo:
+        """
+        Collision tests between pairs of shapes.
+
+        Each test receives the bounds of both shapes, and returns a tuple
+        `(hit, point, angle)`, where `point` is a point of the contact, and
+        `angle` is the direction, in radians, from the center of the first
+        shape to the center of the second shape, as given by
+        `atan2(delta_x, delta_y)`. The bounding boxes of the shapes are
+        tested first, so tests for objects far apart are cheap.
+        """
+
         # pylint: disable=invalid-name
+
         @staticmethod
-        def __distance_to_ellipse(ellipse, point):
-            x, y = point
-            h, k, rx, ry, angle = ellipse
-            rx, ry = (rx // 2, ry // 2) if rx <= ry else (ry // 2, rx // 2)
-            sina = sin(-1 * radians(angle))
-            cosa = cos(-1 * radians(angle))
-            xh = x - h
-            yk = y - k
-            t1 = xh * cosa - yk * sina
-            t2 = xh * sina + yk * cosa
-            return ((t1 * t1) / (rx * rx)) + ((t2 * t2) / (ry * ry))
-
-        @classmethod
-        def ellipse_point(cls, ellipse, point):
-            """Verify colision between an ellipse and a rectangle."""
-            return cls.__distance_to_ellipse(ellipse, point) <= 0.95
-
-        @classmethod
-        def ellipse_circle(cls, ellipse, circle):
-            """Verify colision between an ellipse and a rectangle."""
-            x, y, r = circle
-            return cls.__distance_to_ellipse(ellipse, (x, y)) <= (1 + r)
-
-        @classmethod
-        def ellipse_rect(cls, ellipse, rect):
-            """Verify colision between an ellipse and a rectangle."""
-            x, y, width, height = rect
-            for p in (
-                (x, y),
-                (x, y + height),
-                (x + width, y),
-                (x + width, y + height),
-            ):
-                d = cls.__distance_to_ellipse(ellipse, p)
-                if d <= 0.95:
-                    return True
-            return False
-
-        @classmethod
-        def ellipse_ellipse(cls, e1, e2):  # pylint: disable=unused-argument
-            """Verify collision between two ellipses."""
-            raise NotImplementedError("Not implemented: `ellipse_ellipse`")
-
-        @classmethod
-        def ellipse_line(cls, ellipse, line):
-            """Verify colision between an ellipse and a rectangle."""
-            for p in line:
-                if cls.ellipse_point(ellipse, p):
-                    return True
-            return False
-
-        @classmethod
-        def circle_rect(cls, circle, rect):
-            """Verify colision between an ellipse and a rectangle."""
-            x, y, w, h = rect
-            cx, cy, r = circle
-            r *= r
-            for a, b in [(x, y), (x + w, y), (x, y + h), (x + w, y + h)]:
-                dx = (a - cx) ** 2
-                dy = (b - cy) ** 2
-                if (dx + dy) < r:
-                    return True
-            return False
-
-        @classmethod
-        def circle_circle(cls, c1, c2):
-            """Verify colision between an ellipse and a rectangle."""
+        def circle_circle(c1, c2):
+            """Verify collision between two circles."""
             cx1, cy1, r1 = c1
             cx2, cy2, r2 = c2
+            if abs(cx1 - cx2) > r1 + r2 or abs(cy1 - cy2) > r1 + r2:
+                return _MISS
             h = (cx1 - cx2) ** 2 + (cy1 - cy2) ** 2
             r = (r1 + r2) ** 2
-            #
+            if h > r:
+                return _MISS
             point = (cx1 + (cx2 - cx1) / 2, cy1 + (cy2 - cy1) / 2)
             angle = atan2(cx2 - cx1, cy2 - cy1)
-            return (h <= r, point, angle)
+            return (True, point, angle)
+
+        @staticmethod
+        def circle_rect(circle, rect):
+            """Verify collision between a circle and a rectangle."""
+            cx, cy, r = circle
+            x, y, w, h = rect
+            right, bottom = x + w, y + h
+            if cx + r < x or cx - r > right or cy + r < y or cy - r > bottom:
+                return _MISS
+            # closest point of the rectangle to the circle center.
+            px = min(max(cx, x), right)
+            py = min(max(cy, y), bottom)
+            if (px - cx) ** 2 + (py - cy) ** 2 > r * r:
+                return _MISS
+            return (True, (px, py), atan2(x + w / 2 - cx, y + h / 2 - cy))
+
+        @staticmethod
+        def circle_point(circle, point):
+            """Verify collision between a circle and a point."""
+            cx, cy, r = circle
+            x, y = point
+            if (x - cx) ** 2 + (y - cy) ** 2 > r * r:
+                return _MISS
+            return (True, (x, y), atan2(x - cx, y - cy))
+
+        @staticmethod
+        def ellipse_circle(ellipse, circle):
+            """Verify collision between an ellipse and a circle."""
+            # pylint: disable=too-many-locals
+            ex, ey, width, height, _, sin_a, cos_a = ellipse
+            cx, cy, r = circle
+            if width <= 0 or height <= 0:
+                return _MISS
+            half_width, half_height = _ellipse_extent(ellipse)
+            dx, dy = cx - ex, cy - ey
+            if abs(dx) > half_width + r or abs(dy) > half_height + r:
+                return _MISS
+            a, b = width / 2, height / 2
+            # circle center, in the frame of the ellipse.
+            lx = dx * cos_a + dy * sin_a
+            ly = dy * cos_a - dx * sin_a
+            if (lx / a) ** 2 + (ly / b) ** 2 <= 1:
+                return (True, (cx, cy), atan2(dx, dy))
+            qx, qy = _closest_on_ellipse(a, b, lx, ly)
+            if (qx - lx) ** 2 + (qy - ly) ** 2 > r * r:
+                return _MISS
+            point = (
+                ex + qx * cos_a - qy * sin_a,
+                ey + qx * sin_a + qy * cos_a,
+            )
+            return (True, point, atan2(dx, dy))
 
-        @classmethod
-        def point_rect(cls, point, rect):
+        @staticmethod
+        def ellipse_rect(ellipse, rect):
+            """Verify collision between an ellipse and a rectangle."""
+            # pylint: disable=too-many-locals,too-many-return-statements
+            ex, ey, width, height = ellipse[:4]
+            x, y, w, h = rect
+            if width <= 0 or height <= 0:
+                return _MISS
+            right, bottom = x + w, y + h
+            half_width, half_height = _ellipse_extent(ellipse)
+            if ex + half_width < x or ex - half_width > right:
+                return _MISS
+            if ey + half_height < y or ey - half_height > bottom:
+                return _MISS
+            angle = atan2(x + w / 2 - ex, y + h / 2 - ey)
+            if x <= ex <= right and y <= ey <= bottom:
+                return (True, (ex, ey), angle)
+            # As the ellipse contains its center, if they collide, the
+            # ellipse crosses a side of the rectangle facing its center.
+            if not x <= ex <= right:
+                side = x if ex < x else right
+                t = _ellipse_segment(ellipse, side, y, side, bottom)
+                if t >= 0:
+                    return (True, (side, y + t * h), angle)
+            if not y <= ey <= bottom:
+                side = y if ey < y else bottom
+                t = _ellipse_segment(ellipse, x, side, right, side)
+                if t >= 0:
+                    return (True, (x + t * w, side), angle)
+            return _MISS
+
+        @staticmethod
+        def ellipse_ellipse(e1, e2):
+            """
+            Verify collision between two ellipses.
+
+            The second ellipse is transformed to the frame where the first
+            one is a circle of unit radius, where it is still an ellipse,
+            with axes given by the singular value decomposition of the
+            transformation. The ellipses collide if the point of the
+            transformed ellipse closest to the origin is in the circle.
+            """
+            # pylint: disable=too-many-locals
+            x1, y1, w1, h1, _, s1, c1 = e1
+            x2, y2, w2, h2, _, s2, c2 = e2
+            if min(w1, h1, w2, h2) <= 0:
+                return _MISS
+            half_w1, half_h1 = _ellipse_extent(e1)
+            half_w2, half_h2 = _ellipse_extent(e2)
+            dx, dy = x2 - x1, y2 - y1
+            if abs(dx) > half_w1 + half_w2 or abs(dy) > half_h1 + half_h2:
+                return _MISS
+            a1, b1, a2, b2 = w1 / 2, h1 / 2, w2 / 2, h2 / 2
+            # center of the second ellipse, in the first ellipse frame.
+            mx = (dx * c1 + dy * s1) / a1
+            my = (dy * c1 - dx * s1) / b1
+            # transformation of the second ellipse axes, relative rotation.
+            sin_r, cos_r = s2 * c1 - c2 * s1, c2 * c1 + s2 * s1
+            p, q = cos_r * a2 / a1, -sin_r * b2 / a1
+            r, t = sin_r * a2 / b1, cos_r * b2 / b1
+            # singular value decomposition of [[p, q], [r, t]].
+            e, f, g, h = (p + t) / 2, (p - t) / 2, (r + q) / 2, (r - q) / 2
+            major = hypot(e, h) + hypot(f, g)
+            minor = max(abs(hypot(e, h) - hypot(f, g)), major * 1e-12)
+            phi = (atan2(h, e) + atan2(g, f)) / 2
+            sin_p, cos_p = sin(phi), cos(phi)
+            # origin, in the frame of the transformed second ellipse.
+            ox = -(mx * cos_p + my * sin_p)
+            oy = -(my * cos_p - mx * sin_p)
+            if (ox / major) ** 2 + (oy / minor) ** 2 <= 1:
+                return (True, (x1, y1), atan2(dx, dy))
+            qx, qy = _closest_on_ellipse(major, minor, ox, oy)
+            if (qx - ox) ** 2 + (qy - oy) ** 2 > 1:
+                return _MISS
+            ux = (mx + qx * cos_p - qy * sin_p) * a1
+            uy = (my + qx * sin_p + qy * cos_p) * b1
+            point = (x1 + ux * c1 - uy * s1, y1 + ux * s1 + uy * c1)
+            return (True, point, atan2(dx, dy))
+
+        @staticmethod
+        def ellipse_line(ellipse, line):
+            """Verify collision between an ellipse and a line segment."""
+            ex, ey, width, height = ellipse[:4]
+            x1, y1, x2, y2 = line
+            if width <= 0 or height <= 0:
+                return _MISS
+            half_width, half_height = _ellipse_extent(ellipse)
+            if min(x1, x2) > ex + half_width or max(x1, x2) < ex - half_width:
+                return _MISS
+            if (
+                min(y1, y2) > ey + half_height
+                or max(y1, y2) < ey - half_height
+            ):
+                return _MISS
+            t = _ellipse_segment(ellipse, x1, y1, x2, y2)
+            if t < 0:
+                return _MISS
+            point = (x1 + t * (x2 - x1), y1 + t * (y2 - y1))
+            return (True, point, atan2((x1 + x2) / 2 - ex, (y1 + y2) / 2 - ey))
+
+        @staticmethod
+        def ellipse_point(ellipse, point):
+            """Verify collision between an ellipse and a point."""
+            ex, ey, width, height, _, sin_a, cos_a = ellipse
+            x, y = point
+            if width <= 0 or height <= 0:
+                return _MISS
+            dx, dy = x - ex, y - ey
+            lx = (dx * cos_a + dy * sin_a) / (width / 2)
+            ly = (dy * cos_a - dx * sin_a) / (height / 2)
+            if lx * lx + ly * ly > 1:
+                return _MISS
+            return (True, (x, y), atan2(dx, dy))
+
+        @staticmethod
+        def point_rect(point, rect):
             """Verify collision between point and rectangle."""
             xo, yo = point
             x, y, w, h = rect
-            return (x <= xo <= x + w) and (y <= yo <= y + h)
+            if not (x <= xo <= x + w and y <= yo <= y + h):
+                return _MISS
+            return (True, (xo, yo), atan2(x + w / 2 - xo, y + h / 2 - yo))
+
+        @staticmethod
+        def point_point(p1, p2):
+            """Verify collision between two points."""
+            x1, y1 = p1
+            x2, y2 = p2
+            if (x2 - x1) ** 2 + (y2 - y1) ** 2 > _EPSILON * _EPSILON:
+                return _MISS
+            return (True, (x1, y1), atan2(x2 - x1, y2 - y1))
 
-        @classmethod
-        def rect_rect(cls, r1, r2):
-            """Verify colision between an ellipse and a rectangle."""
+        @staticmethod
+        def rect_rect(r1, r2):
+            """Verify collision between two rectangles."""
             x1, y1, w1, h1 = r1
             x2, y2, w2, h2 = r2
             if x1 > x2 + w2 or x1 + w1 < x2:
-                return False
+                return _MISS
             if y1 > y2 + h2 or y1 + h1 < y2:
-                return False
-            return True
+                return _MISS
+            # center of the intersection of both rectangles.
+            point = (
+                (max(x1, x2) + min(x1 + w1, x2 + w2)) / 2,
+                (max(y1, y2) + min(y1 + h1, y2 + h2)) / 2,
+            )
+            angle = atan2(x2 + w2 / 2 - x1 - w1 / 2, y2 + h2 / 2 - y1 - h1 / 2)
+            return (True, point, angle)
 
-        @classmethod
-        def line_line(cls, l1, l2):
+        @staticmethod
+        def line_line(l1, l2):
             """Check if a line segment intersects another."""
+            # pylint: disable=too-many-locals,too-many-return-statements
+            x1, y1, x2, y2 = l1
+            x3, y3, x4, y4 = l2
+            if max(x1, x2) < min(x3, x4) or min(x1, x2) > max(x3, x4):
+                return _MISS
+            if max(y1, y2) < min(y3, y4) or min(y1, y2) > max(y3, y4):
+                return _MISS
+            angle = atan2((x3 + x4 - x1 - x2) / 2, (y3 + y4 - y1 - y2) / 2)
+            d1x, d1y, d2x, d2y = x2 - x1, y2 - y1, x4 - x3, y4 - y3
+            ex, ey = x3 - x1, y3 - y1
+            denominator = d1x * d2y - d1y * d2x
+            if denominator != 0:
+                t = (ex * d2y - ey * d2x) / denominator
+                u = (ex * d1y - ey * d1x) / denominator
+                if not (0 <= t <= 1 and 0 <= u <= 1):
+                    return _MISS
+                return (True, (x1 + t * d1x, y1 + t * d1y), angle)
+            # parallel segments, which collide if on the same line, and
+            # overlapping, measured over the longest one.
+            if d1x * d1x + d1y * d1y < d2x * d2x + d2y * d2y:
+                x1, y1, d1x, d1y, ex, ey = x3, y3, d2x, d2y, -ex, -ey
+                x3, y3, x4, y4 = l1
+            length = d1x * d1x + d1y * d1y
+            if length == 0:
+                return (True, (x1, y1), angle)
+            if ex * d1y - ey * d1x != 0:
+                return _MISS
+            t3 = (ex * d1x + ey * d1y) / length
+            t4 = ((x4 - x1) * d1x + (y4 - y1) * d1y) / length
+            start, end = max(0, min(t3, t4)), min(1, max(t3, t4))
+            if start > end:
+                return _MISS
+            t = (start + end) / 2
+            return (True, (x1 + t * d1x, y1 + t * d1y), angle)
 
-            def abc(p1, p2):
-                x1, y1 = p1
-                x2, y2 = p2
-                a = y2 - y1
-                b = x1 - x2
-                c = x2 * y1 - x1 * y2
-                return (a, b, c)
-
-            def verify(abc, p1, p2):
-                a, b, c = abc
-                x1, y1 = p1
-                x2, y2 = p2
-                r1 = a * x2 + b * y1 + c
-                r2 = a * x1 + b * y2 + c
-                return r1 != 0 and r2 != 0 and copysign(1, r1) == copysign(r2)
-
-            p1, p2 = l1
-            p3, p4 = l2
-
-            if verify(abc(p1, p2), p3, p4):
-                return False
-            if verify(abc(p3, p4), p1, p2):
-                return False
-            return True
-
-        @classmethod
-        def line_rect(cls, line, rect):
+        @staticmethod
+        def line_rect(line, rect):
             """Check if a line segment intersects a rectangle."""
-            p1, p2 = line
+            x1, y1, x2, y2 = line
             x, y, w, h = rect
-            if cls.point_rect(p1, rect) or cls.point_rect(p2, rect):
-                return True
-            for _line in (
-                ((x, y), (x + w, y)),
-                ((x, y), (x, y + h)),
-                ((x, y + h), (x + w, y + h)),
-                ((x + w, y), (x + w, y + h)),
-            ):
-                if cls.line_line(line, _line):
-                    return True
-            return False
+            if max(x1, x2) < x or min(x1, x2) > x + w:
+                return _MISS
+            if max(y1, y2) < y or min(y1, y2) > y + h:
+                return _MISS
+            # Clip the segment parameter range to the rectangle.
+            span = _clip_segment(x1, x2 - x1, x, x + w, (0.0, 1.0))
+            start, end = _clip_segment(y1, y2 - y1, y, y + h, span)
+            if start > end:
+                return _MISS
+            point = (x1 + start * (x2 - x1), y1 + start * (y2 - y1))
+            angle = atan2(x + (w - x1 - x2) / 2, y + (h - y1 - y2) / 2)
+            return (True, point, angle)
 
-        @classmethod
-        def line_circle(cls, line, circle):  # pylint: disable=unused-argument
+        @staticmethod
+        def line_circle(line, circle):
             """Check if a line segment intersects a circle."""
-            raise NotImplementedError("Not implemented: `ellipse_ellipse`")
+            x1, y1, x2, y2 = line
+            cx, cy, r = circle
+            if min(x1, x2) > cx + r or max(x1, x2) < cx - r:
+                return _MISS
+            if min(y1, y2) > cy + r or max(y1, y2) < cy - r:
+                return _MISS
+            px, py = _closest_on_segment(line, cx, cy)
+            if (px - cx) ** 2 + (py - cy) ** 2 > r * r:
+                return _MISS
+            angle = atan2(cx - (x1 + x2) / 2, cy - (y1 + y2) / 2)
+            return (True, (px, py), angle)
+
+        @staticmethod
+        def line_point(line, point):
+            """Check if a point is on a line segment."""
+            x1, y1, x2, y2 = line
+            x, y = point
+            if not min(x1, x2) - _EPSILON <= x <= max(x1, x2) + _EPSILON:
+                return _MISS
+            if not min(y1, y2) - _EPSILON <= y <= max(y1, y2) + _EPSILON:
+                return _MISS
+            px, py = _closest_on_segment(line, x, y)
+            if (px - x) ** 2 + (py - y) ** 2 > _EPSILON * _EPSILON:
+                return _MISS
+            return (True, (x, y), atan2(x - (x1 + x2) / 2, y - (y1 + y2) / 2))
 
-        @classmethod
-        def invert(cls, fn):
-            """Invert function arguments."""
+        @staticmethod
+        def invert(fn):
+            """Invert function arguments, and the direction of the result."""
 
             def do_it(a, b):
-                return fn(b, a)
+                hit, point, angle = fn(b, a)
+                if hit:
+                    return (True, point, angle + pi)
+                return _MISS
 
             return do_it
 
     __functions = {
-        "ellipse_rect": __Algo.ellipse_rect,
-        "rect_ellipse": __Algo.invert(__Algo.ellipse_rect),
-        "ellipse_circle": __Algo.ellipse_circle,
-        "circle_ellipse": __Algo.invert(__Algo.ellipse_circle),
+        "circle_circle": __Algo.circle_circle,
         "circle_rect": __Algo.circle_rect,
         "rect_circle": __Algo.invert(__Algo.circle_rect),
-        "rect_rect": __Algo.rect_rect,
-        "circle_circle": __Algo.circle_circle,
+        "circle_point": __Algo.circle_point,
+        "point_circle": __Algo.invert(__Algo.circle_point),
+        "ellipse_circle": __Algo.ellipse_circle,
+        "circle_ellipse": __Algo.invert(__Algo.ellipse_circle),
+        "ellipse_rect": __Algo.ellipse_rect,
+        "rect_ellipse": __Algo.invert(__Algo.ellipse_rect),
         "ellipse_ellipse": __Algo.ellipse_ellipse,
-        "line_line": __Algo.line_line,
-        # circle-line collision not implemented yet
-        "line_circle": __Algo.line_circle,
-        "circle_line": __Algo.invert(__Algo.line_circle),
-        "line_rect": __Algo.line_rect,
-        "rect_line": __Algo.invert(__Algo.line_rect),
-        "line_ellipse": __Algo.invert(__Algo.ellipse_line),
         "ellipse_line": __Algo.ellipse_line,
-        "point_ellipse": __Algo.invert(__Algo.ellipse_point),
+        "line_ellipse": __Algo.invert(__Algo.ellipse_line),
         "ellipse_point": __Algo.ellipse_point,
+        "point_ellipse": __Algo.invert(__Algo.ellipse_point),
         "point_rect": __Algo.point_rect,
         "rect_point": __Algo.invert(__Algo.point_rect),
+        "point_point": __Algo.point_point,
+        "rect_rect": __Algo.rect_rect,
+        "line_line": __Algo.line_line,
+        "line_rect": __Algo.line_rect,
+        "rect_line": __Algo.invert(__Algo.line_rect),
+        "line_circle": __Algo.line_circle,
+        "circle_line": __Algo.invert(__Algo.line_circle),
+        "line_point": __Algo.line_point,
+        "point_line": __Algo.invert(__Algo.line_point),
     }
+
+    __dispatch = _dispatch_table(SHAPES, __functions)
@@ -22,10 +22,24 @@
 import math
 from collections import defaultdict
 from genesis.engine.events import GameEvent
+from genesis.objects import modifies_result_of
+from genesis.behavior.basic import CacheCounters
 
 
 class Movable:
-    """Base class for all objects that can be moved."""
+    """
+    Base class for all objects that can be moved.
+
+    The object position, with integer coordinates, is computed only when
+    the object moves, with `update()`, and the number of times it was
+    reused is counted by `Movable.position_cache`.
+    """
+
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__x", "__y", "__delta_x", "__delta_y", "__position")
+
+    position_cache = CacheCounters()
 
     def __init__(self, **options):
         """Initialize game object."""
@@ -33,6 +47,7 @@ class Movable:
         values = options.get("position", (0, 0))
         self.__x, self.__y = self._extract_list_values(values)
         self.__delta_x, self.__delta_y = (0, 0)
+        self.__position = (int(self.__x), int(self.__y))
 
     def update(self):
         """Update object position."""
@@ -42,11 +57,17 @@ class Movable:
         y += delta_y
         self.__x, self.__y = x, y
         self.__delta_x, self.__delta_y = (0, 0)
+        position = (int(x), int(y))
+        if position != self.__position:
+            self.__position = position
+            Movable.position_cache.misses += 1
+            self.geometry_changed()  # pylint: disable=no-member
 
     @property
     def position(self):
         """Retrieve object position."""
-        return (int(self.__x), int(self.__y))
+        Movable.position_cache.hits += 1
+        return self.__position
 
     def move(self, delta_x, delta_y):
         """Move object by an amount in the x and y axis."""
@@ -75,18 +96,22 @@ class LimitMovement:
     # pylint: disable=no-member, too-few-public-methods
     # We do rely on late binding for most GameObject and behaviors.
 
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__limit_area",)
+
     def __init__(self, **options):
         """Initialize game object."""
         # pylint: disable=no-member
         # TODO: assert limit_area has 4 values, and w and h are greater than 0.
         values = options.get("limit_area", [0, 0, -1, -1])
         self.__limit_area = self._extract_list_values(values)
-        self.modify_result_of(self.delta_move, self.__verify_limits)
 
     def limit_area(self):
         """Query object limited movement area."""
         return self.__limit_area
 
+    @modifies_result_of("delta_move")
     def __verify_limits(self, delta_x, delta_y):
         limit_x, limit_y, limit_width, limit_height = self.__limit_area
         x, y = self.position
@@ -128,14 +153,16 @@ class LimitMovement:
 class LinearMove(Movable):
     """Move an object linearly."""
 
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__speed", "__angle")
+
     def __init__(self, **options):
         """Initialize movement object."""
         Movable.__init__(self, **options)
         self.__speed = options.get("speed", 5)
         angle = options.get("angle", 0)
         self.__angle = 2 * math.pi - math.radians(angle)
-        self.__dx = 0
-        self.__dy = 0
 
     def delta_move(self):
         """Retrieve the amount of movement for the object."""
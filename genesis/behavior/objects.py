@@ -22,15 +22,29 @@
 import pygame  # pylint: disable=import-error
 
 from genesis.behavior import Drawable
+from genesis.behavior.basic import CacheCounters
+from genesis.objects import runs_after
 
 
 class Circle(Drawable):
-    """A Circle shaped object."""
+    """
+    A Circle shaped object.
+
+    The circle center is cached until the object geometry changes, and the
+    number of times it was reused is counted by `Circle.center_cache`.
+    """
+
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__radius", "__center")
+
+    center_cache = CacheCounters()
 
     def __init__(self, **options):
         """Initialize the circle object."""
         Drawable.__init__(self, **options)
         self.__radius = options.get("radius", 1)
+        self.__center = None
 
     def draw(self, screen):
         """Draw Circle to surface."""
@@ -47,18 +61,30 @@ class Circle(Drawable):
     @radius.setter
     def radius(self, value):
         """Set theo radius value."""
-        if value >= 0:
+        if value >= 0 and value != self.__radius:
             self.__radius = value
+            self.geometry_changed()  # pylint: disable=no-member
 
     @property
     def center(self):
         """Retrieve the central point of the object."""
-        x, y = (0, 0)
-        if hasattr(self, "position"):
-            x, y = getattr(self, "position")
-            x += self.__radius
-            y += self.__radius
-        return (x, y)
+        center = self.__center
+        if center is None:
+            Circle.center_cache.misses += 1
+            x, y = (0, 0)
+            if hasattr(self, "position"):
+                x, y = getattr(self, "position")
+                x += self.__radius
+                y += self.__radius
+            center = self.__center = (x, y)
+        else:
+            Circle.center_cache.hits += 1
+        return center
+
+    @runs_after("geometry_changed")
+    def __discard_center(self):
+        """Discard the cached center, after the object geometry changes."""
+        self.__center = None
 
     @property
     def dimension(self):
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Compiled event handler actions."""
+
+
+class Action:
+    # pylint: disable=too-few-public-methods
+    """
+    An event handler action, ready to be executed.
+
+    An action has an optional `guard`, the compiled `when` expression, whose
+    source is kept in `when`, and a list of compiled statements. Each
+    statement is a tuple `(compiled_statement, calls)`, where `calls` is
+    either None or a list of dicts, with the parameters for each execution
+    of the statement. If `batched` is true, the guard can be evaluated for
+    many events at once.
+    """
+
+    def __init__(self, source, guard, statements, batched=False):
+        """Initialize the action."""
+        self.source = source
+        self.guard = guard
+        self.when = str(source["when"]) if guard is not None else None
+        self.statements = statements
+        self.batched = batched
+
+    def __repr__(self):
+        """Retrieve a representation of the action source."""
+        return repr(self.source)
+
+
+def compile_actions(interpreter, actions, where):
+    """
+    Compile the actions of an event handler.
+
+    Parameters:
+        interpreter:
+            The interpreter used to compile expressions and statements.
+        actions:
+            The list of actions, as described in the game script.
+        where:
+            A description of the event handler, used in error messages.
+
+    Returns a tuple `(compiled_actions, errors)`, where `errors` is a list
+    of error messages for every invalid action found.
+    """
+    compiled = []
+    errors = []
+    if not isinstance(actions, list):
+        return compiled, ["%s: actions must be a list." % where]
+    for action in actions:
+        if not isinstance(action, dict) or "do" not in action:
+            errors.append("%s: action without `do`: %s" % (where, action))
+        else:
+            compiled.append(
+                _compile_action(interpreter, action, where, errors)
+            )
+    return compiled, errors
+
+
+def _compile_action(interpreter, action, where, errors):
+    """Compile a single action, appending any error found to `errors`."""
+    guard = None
+    batched = False
+    if "when" in action:
+        when = str(action["when"])
+        try:
+            guard = interpreter.compile_expression(when)
+            batched = interpreter.vector_identifiers(when) is not None
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append("%s: `when: %s`: %s" % (where, when, error))
+    statements = action["do"]
+    if not isinstance(statements, list):
+        statements = [statements]
+    compiled_statements = []
+    for statement in statements:
+        try:
+            compiled_statements.append(
+                _compile_statement(interpreter, statement)
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append("%s: `%s`: %s" % (where, statement, error))
+    return Action(action, guard, compiled_statements, batched)
+
+
+def _compile_statement(interpreter, statement):
+    """Compile a single statement of an action `do` list."""
+    calls = None
+    if isinstance(statement, dict):
+        if len(statement) != 1:
+            raise Exception("Multiple event action: %s" % statement)
+        statement, calls = next(iter(statement.items()))
+        if not calls:
+            calls = None
+        elif not isinstance(calls, list):
+            calls = [calls]
+        for call in calls or []:
+            if not isinstance(call, dict):
+                raise Exception("Invalid parameters: %s" % call)
+    return (interpreter.compile_statement(str(statement)), calls)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Bindings of identifiers used in the Genesis action language."""
+
+from collections.abc import Mapping
+
+# Marker for values not found, when None is a valid value.
+_MISSING = object()
+
+
+class Binding:
+    # pylint: disable=too-few-public-methods
+    """
+    The accessor used to retrieve the value of an identifier.
+
+    The identifier is classified once, and the accessor only performs the
+    lookups that can resolve it, in order:
+        - a global object member (`screen.width`);
+        - a caller or game method, called with the scope as keyword
+          arguments (`flip_horizontal_movement`, `self.spawn`);
+        - a scope value, like event fields (`collision.angle`).
+
+    The global object, if any, is resolved when the binding is first used,
+    and only resolved again when the game `names_version` changes, as
+    objects are added or removed. The version and the object are
+    published together, in a single assignment, so evaluations in other
+    threads, or nested evaluations, never use an object resolved for a
+    different version.
+
+    Failed lookups never rely on exceptions. An exception is raised only
+    if the identifier cannot be resolved at all. A binding does not hold
+    evaluation state, so it can be used by many evaluation contexts.
+    """
+
+    def __init__(self, game, identifier):
+        """Initialize the binding for identifier."""
+        self.__game = game
+        self.__identifier = identifier
+        self.__parts = identifier.split(".")
+        self.__objname, *self.__members = self.__parts
+        # a method might be called only for `name` or `self.name`.
+        self.__callee = None
+        if self.__objname == "self":
+            if len(self.__members) == 1:
+                self.__callee = self.__members[0]
+        elif not self.__members:
+            self.__callee = self.__objname
+        self.__is_global = self.__objname != "self"
+        # (names_version, global object or None)
+        self.__resolved = (None, None)
+
+    def __call__(self, context):
+        """Retrieve the value of the identifier, in the given context."""
+        obj = self.__global_object()
+        if obj is None:
+            return self.__local_value(context.scope)
+        return self.__global_value(obj, context.scope)
+
+    def values(self, scopes):
+        """Retrieve the value of the identifier, for each scope."""
+        obj = self.__global_object()
+        if obj is not None:
+            value = self.__object_member(obj)
+            if value is not _MISSING:
+                return [value] * len(scopes)
+        return [self.__local_value(scope) for scope in scopes]
+
+    def __global_object(self):
+        """Retrieve the global object, resolving it if names changed."""
+        version, obj = self.__resolved
+        current = self.__game.names_version
+        if version != current:
+            obj = None
+            if self.__is_global:
+                obj = self.__game.find_object(self.__objname)
+            self.__resolved = (current, obj)
+        return obj
+
+    def __global_value(self, obj, scope):
+        """Retrieve the value of a global object member, or a local one."""
+        value = obj
+        for member in self.__members:
+            value = getattr(value, member, _MISSING)
+            if value is _MISSING:
+                return self.__local_value(scope)
+        return value
+
+    def __local_value(self, scope):
+        """Retrieve the value of the identifier, if it is not global."""
+        if self.__callee is not None:
+            value = self.__method_result(scope)
+            if value is not _MISSING:
+                return value
+        return self.__scope_value(scope)
+
+    def __object_member(self, obj):
+        """Retrieve the value of a member of the global object."""
+        value = obj
+        for member in self.__members:
+            value = getattr(value, member, _MISSING)
+            if value is _MISSING:
+                break
+        return value
+
+    def __method_result(self, scope):
+        """Retrieve the result of calling a caller, or game, method."""
+        caller = scope.get("caller")
+        if caller is None or self.__callee == caller.name:
+            return _MISSING
+        method = getattr(caller, self.__callee, _MISSING)
+        if method is _MISSING:
+            method = getattr(self.__game, self.__callee, _MISSING)
+        if not callable(method):
+            return _MISSING
+        return method(**scope)
+
+    def __scope_value(self, scope):
+        """Retrieve a value from the scope."""
+        data = scope
+        names = self.__parts
+        if scope.get("name") == self.__objname:
+            names = self.__members
+        for name in names:
+            if not isinstance(data, Mapping) or name not in data:
+                raise Exception(
+                    "Could not find value for `%s`" % self.__identifier
+                )
+            data = data[name]
+        return dict(data) if data is scope else data
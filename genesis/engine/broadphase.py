@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Collision broadphase, selecting pairs of objects that might collide."""
+
+from itertools import combinations
+from math import floor
+
+# Collision layer bits of objects in all layers, or masks of all layers.
+ALL_LAYERS = -1
+
+
+def _compatible(first, second):
+    """Check if the `(layer, mask)` of two objects allow them to collide."""
+    return first[0] & second[1] and second[0] & first[1]
+
+
+def _select(found, order, layers, filter_layers):
+    """Retrieve the found objects with compatible layers, in order."""
+    return sorted(
+        (obj for obj in found if _compatible(filter_layers, layers[obj])),
+        key=order.__getitem__,
+    )
+
+
+def _ordered_pairs(objects, candidates, layers):
+    """
+    Retrieve the unordered pairs of candidates, each pair once.
+
+    `objects` must be sorted by the broadphase `order`, and `candidates`
+    must return the candidates of an object, in the same order. Pairs of
+    objects with incompatible `layers` are skipped. The pairs are returned
+    in order of their first, and then of their second object.
+    """
+    rank = {obj: position for position, obj in enumerate(objects)}
+    return [
+        (obj, other)
+        for obj in objects
+        for other in candidates(obj)
+        if rank[other] > rank[obj] and _compatible(layers[obj], layers[other])
+    ]
+
+
+class SpatialHash:
+    """
+    A uniform grid of cells, indexing objects by their bounding boxes.
+
+    Every object is registered in all cells its bounding box overlaps, and
+    the candidates for collision with an object are the objects sharing a
+    cell with it. Objects without a bounding box (`None`), for which the
+    extent cannot be bounded, are candidates for every object.
+
+    Candidates are returned in the order of the `order` value given when
+    the object was inserted, so collisions are always reported in the same
+    order, no matter how the objects are distributed in the grid.
+    """
+
+    def __init__(self, cell_size=64):
+        """Initialize the grid, with square cells of `cell_size` side."""
+        if cell_size <= 0:
+            raise Exception("Invalid cell size: %s" % cell_size)
+        self.cell_size = cell_size
+        self.__cells = {}
+        self.__order = {}
+        self.__layers = {}
+        self.__ranges = {}
+        self.__unbounded = set()
+
+    def __len__(self):
+        """Retrieve the number of objects in the grid."""
+        return len(self.__order)
+
+    def insert(self, obj, order, box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """
+        Insert an object in the grid.
+
+        Parameters:
+            obj:
+                The object to insert.
+            order:
+                A number used to sort the object among candidates.
+            box:
+                The object bounding box, a tuple `(min_x, min_y, max_x,
+                max_y)`, or None, if the object extent cannot be bounded.
+            layer:
+                The bits of the collision layers of the object.
+            mask:
+                The bits of the collision layers the object collides with.
+                Two objects are a pair only if the layer of each object
+                has a bit in common with the mask of the other one.
+        """
+        self.__order[obj] = order
+        self.__layers[obj] = (layer, mask)
+        self.__ranges[obj] = None
+        self.move(obj, box)
+
+    def remove(self, obj):
+        """Remove an object from the grid."""
+        self.__set_range(obj, None)
+        self.__unbounded.discard(obj)
+        del self.__ranges[obj]
+        del self.__order[obj]
+        del self.__layers[obj]
+
+    def move(self, obj, box):
+        """Update the cells of an object, given its new bounding box."""
+        if box is None:
+            self.__set_range(obj, None)
+            self.__unbounded.add(obj)
+            return
+        self.__unbounded.discard(obj)
+        self.__set_range(obj, self.__cell_range(box))
+
+    def update(self, objects, box_of):
+        """Update the cells of all objects, with `box_of(obj)`."""
+        for obj in objects:
+            self.move(obj, box_of(obj))
+
+    def candidates(self, obj):
+        """Retrieve the objects that might collide with an object, in order."""
+        if obj in self.__unbounded:
+            found = set(self.__order)
+        else:
+            found = set(self.__unbounded)
+            for cell in self.__cells_in(self.__ranges[obj]):
+                found.update(self.__cells[cell])
+        found.discard(obj)
+        return sorted(found, key=self.__order.__getitem__)
+
+    def query(self, box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """
+        Retrieve the objects that might collide with a bounding box.
+
+        The objects are returned in order, and only the ones whose layers
+        are compatible with the given `layer` and `mask` are returned. If
+        `box` is None, all compatible objects are returned.
+        """
+        if box is None:
+            found = set(self.__order)
+        else:
+            found = set(self.__unbounded)
+            cells = self.__cells
+            for cell in self.__cells_in(self.__cell_range(box)):
+                found.update(cells.get(cell, ()))
+        return _select(found, self.__order, self.__layers, (layer, mask))
+
+    def pairs(self):
+        """
+        Retrieve the pairs of objects that might collide, each pair once.
+
+        The pairs are tuples `(obj, other)`, where `obj` was inserted with
+        a lower `order` than `other`, and are returned sorted by order.
+        Pairs of objects whose collision layers and masks are not
+        compatible are skipped.
+        """
+        objects = sorted(self.__order, key=self.__order.__getitem__)
+        return _ordered_pairs(objects, self.candidates, self.__layers)
+
+    def __cell_range(self, box):
+        """Retrieve the range of cells overlapped by a bounding box."""
+        size = self.cell_size
+        min_x, min_y, max_x, max_y = box
+        return (
+            floor(min_x / size),
+            floor(min_y / size),
+            floor(max_x / size),
+            floor(max_y / size),
+        )
+
+    def __set_range(self, obj, cell_range):
+        """Move an object to the cells in a cell range."""
+        current = self.__ranges[obj]
+        if current == cell_range:
+            return
+        for cell in self.__cells_in(current):
+            members = self.__cells[cell]
+            members.discard(obj)
+            if not members:
+                del self.__cells[cell]
+        for cell in self.__cells_in(cell_range):
+            self.__cells.setdefault(cell, set()).add(obj)
+        self.__ranges[obj] = cell_range
+
+    @staticmethod
+    def __cells_in(cell_range):
+        """Retrieve the cells in a cell range."""
+        if cell_range is None:
+            return
+        first_x, first_y, last_x, last_y = cell_range
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                yield (cell_x, cell_y)
+
+
+class SweepAndPrune:
+    """
+    A list of objects sorted by the left side of their bounding boxes.
+
+    The candidates for collision with an object are found by sweeping the
+    list, from the object position, over the objects that overlap it in
+    the x axis, and selecting the ones that also overlap it in the y
+    axis. As objects move little between frames, the list is kept sorted
+    with insertion sort, which is close to linear for nearly sorted lists.
+    Objects of mixed sizes do not degrade the search, as it happens with
+    grid cells.
+
+    Objects without a bounding box (`None`) are candidates for every
+    object, and candidates are returned in the order of the `order` value
+    given when the object was inserted.
+    """
+
+    def __init__(self):
+        """Initialize the broadphase."""
+        self.__order = {}
+        self.__layers = {}
+        self.__boxes = {}
+        self.__objects = []
+        self.__index = {}
+        self.__max_width = 0
+        self.__unbounded = set()
+
+    def __len__(self):
+        """Retrieve the number of objects in the broadphase."""
+        return len(self.__order)
+
+    def insert(self, obj, order, box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """Insert an object, with the parameters used by `SpatialHash`."""
+        self.__order[obj] = order
+        self.__layers[obj] = (layer, mask)
+        self.__unbounded.add(obj)
+        self.move(obj, box)
+
+    def remove(self, obj):
+        """Remove an object from the broadphase."""
+        if obj in self.__unbounded:
+            self.__unbounded.discard(obj)
+        else:
+            self.__remove_from_list(obj)
+        del self.__boxes[obj]
+        del self.__order[obj]
+        del self.__layers[obj]
+
+    def move(self, obj, box):
+        """Update the position of an object, given its new bounding box."""
+        if box is None:
+            if obj not in self.__unbounded:
+                self.__remove_from_list(obj)
+                self.__unbounded.add(obj)
+            self.__boxes[obj] = None
+            return
+        self.__boxes[obj] = box
+        self.__max_width = max(self.__max_width, box[2] - box[0])
+        if obj in self.__unbounded:
+            self.__unbounded.discard(obj)
+            self.__index[obj] = len(self.__objects)
+            self.__objects.append(obj)
+        self.__sift(self.__index[obj])
+
+    def update(self, objects, box_of):
+        """
+        Update all objects with `box_of(obj)`, sorting the list once.
+
+        The list is sorted with an insertion sort, taking advantage of the
+        little movement of the objects between frames.
+        """
+        for obj in objects:
+            box = box_of(obj)
+            if box is None or obj in self.__unbounded:
+                self.move(obj, box)
+            else:
+                self.__boxes[obj] = box
+        boxes = self.__boxes
+        items = self.__objects
+        for position in range(1, len(items)):
+            obj = items[position]
+            left = boxes[obj][0]
+            other = position - 1
+            while other >= 0 and boxes[items[other]][0] > left:
+                items[other + 1] = items[other]
+                other -= 1
+            items[other + 1] = obj
+        self.__index = {obj: position for position, obj in enumerate(items)}
+        self.__max_width = max(
+            (boxes[obj][2] - boxes[obj][0] for obj in items), default=0
+        )
+
+    def candidates(self, obj):
+        """Retrieve the objects that might collide with an object, in order."""
+        if obj in self.__unbounded:
+            found = set(self.__order)
+        else:
+            found = set(self.__unbounded)
+            found.update(
+                self.__overlapping(self.__boxes[obj], self.__sweep(obj))
+            )
+        found.discard(obj)
+        return sorted(found, key=self.__order.__getitem__)
+
+    def query(self, box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """Retrieve the objects in a box, as described in `SpatialHash`."""
+        if box is None:
+            found = set(self.__order)
+        else:
+            found = set(self.__unbounded)
+            found.update(self.__overlapping(box, self.__sweep_box(box)))
+        return _select(found, self.__order, self.__layers, (layer, mask))
+
+    def pairs(self):
+        """Retrieve the pairs of candidates, as described in `SpatialHash`."""
+        objects = sorted(self.__order, key=self.__order.__getitem__)
+        return _ordered_pairs(objects, self.candidates, self.__layers)
+
+    def __overlapping(self, box, objects):
+        """Retrieve the objects whose bounding boxes overlap a box."""
+        boxes = self.__boxes
+        min_x, min_y, max_x, max_y = box
+        for other in objects:
+            box = boxes[other]
+            if (
+                box[2] >= min_x
+                and box[0] <= max_x
+                and box[3] >= min_y
+                and box[1] <= max_y
+            ):
+                yield other
+
+    def __sweep(self, obj):
+        """Retrieve the objects that might overlap the object in x axis."""
+        boxes = self.__boxes
+        items = self.__objects
+        position = self.__index[obj]
+        # objects to the left start at most `max_width` before this one.
+        leftmost = boxes[obj][0] - self.__max_width
+        first = position
+        while first > 0 and boxes[items[first - 1]][0] >= leftmost:
+            first -= 1
+        rightmost = boxes[obj][2]
+        last = position
+        while last + 1 < len(items) and boxes[items[last + 1]][0] <= rightmost:
+            last += 1
+        return items[first : last + 1]
+
+    def __sweep_box(self, box):
+        """Retrieve the objects that might overlap a box in x axis."""
+        boxes = self.__boxes
+        items = self.__objects
+        # binary search for the first object starting after the box.
+        last, end = 0, len(items)
+        while last < end:
+            middle = (last + end) // 2
+            if boxes[items[middle]][0] <= box[2]:
+                last = middle + 1
+            else:
+                end = middle
+        leftmost = box[0] - self.__max_width
+        first = last
+        while first > 0 and boxes[items[first - 1]][0] >= leftmost:
+            first -= 1
+        return items[first:last]
+
+    def __sift(self, position):
+        """Move the object at position to keep the list sorted."""
+        boxes = self.__boxes
+        items = self.__objects
+        index = self.__index
+        obj = items[position]
+        left = boxes[obj][0]
+        while position > 0 and boxes[items[position - 1]][0] > left:
+            items[position] = items[position - 1]
+            index[items[position]] = position
+            position -= 1
+        while (
+            position + 1 < len(items) and boxes[items[position + 1]][0] < left
+        ):
+            items[position] = items[position + 1]
+            index[items[position]] = position
+            position += 1
+        items[position] = obj
+        index[obj] = position
+
+    def __remove_from_list(self, obj):
+        """Remove an object from the sorted list."""
+        position = self.__index.pop(obj)
+        del self.__objects[position]
+        for other in self.__objects[position:]:
+            self.__index[other] -= 1
+
+
+class AllPairs:
+    """
+    A broadphase that selects every object as a candidate.
+
+    It is the reference for the other broadphases, and it might be used by
+    games with few objects. Objects must be inserted in `order`.
+    """
+
+    def __init__(self):
+        """Initialize the broadphase."""
+        self.__order = {}
+        self.__layers = {}
+
+    def __len__(self):
+        """Retrieve the number of objects in the broadphase."""
+        return len(self.__order)
+
+    def insert(self, obj, order, _box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """Insert an object, with the parameters used by `SpatialHash`."""
+        self.__order[obj] = order
+        self.__layers[obj] = (layer, mask)
+
+    def remove(self, obj):
+        """Remove an object from the broadphase."""
+        del self.__order[obj]
+        del self.__layers[obj]
+
+    def move(self, obj, box):
+        """Update the position of an object, which is not needed."""
+
+    def update(self, objects, box_of):
+        """Update the position of all objects, which is not needed."""
+
+    def candidates(self, obj):
+        """Retrieve all objects, but `obj`, in order."""
+        return [other for other in self.__order if other is not obj]
+
+    def query(self, _box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """Retrieve all objects with compatible layers, in order."""
+        layers = self.__layers
+        return [
+            obj
+            for obj in self.__order
+            if _compatible((layer, mask), layers[obj])
+        ]
+
+    def pairs(self):
+        """Retrieve every pair of objects with compatible layers, in order."""
+        layers = self.__layers
+        return [
+            (obj, other)
+            for obj, other in combinations(self.__order, 2)
+            if _compatible(layers[obj], layers[other])
+        ]
+
+
+BROADPHASES = {
+    "spatial_hash": SpatialHash,
+    "sweep_and_prune": SweepAndPrune,
+    "all_pairs": AllPairs,
+}
+
+
+def create_broadphase(name="spatial_hash", **options):
+    """
+    Create a broadphase, given its name.
+
+    Available broadphases are `spatial_hash`, with option `cell_size`,
+    `sweep_and_prune` and `all_pairs`.
+    """
+    if name not in BROADPHASES:
+        raise Exception("Invalid collision broadphase: `%s`" % name)
+    try:
+        return BROADPHASES[name](**options)
+    except TypeError as error:
+        raise Exception(
+            "Invalid options for broadphase `%s`: %s" % (name, options)
+        ) from error
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Compile Genesis parse trees to native Python code."""
+
+import ast
+
+from genesis.engine import parsetree
+
+
+class ExpressionCompiler:
+    # pylint: disable=too-few-public-methods
+    """
+    Lower Genesis expression parse trees to Python callables.
+
+    A parse tree is translated to a Python `ast`, and compiled once into a
+    function with the signature `code(context)`, where `context` is the
+    evaluation context of the current execution. Identifiers and language
+    commands are bound at compile time, and the compiled code holds no
+    state of its own, so it can be used by many contexts at the same time.
+    """
+
+    binary_operators = {
+        "+": ast.Add,
+        "-": ast.Sub,
+        "*": ast.Mult,
+        "**": ast.Pow,
+        "/": ast.Div,
+        "//": ast.FloorDiv,
+        "%": ast.Mod,
+    }
+
+    def __init__(self, commands, bind):
+        """
+        Initialize the compiler.
+
+        Parameters:
+            commands:
+                A dict mapping the language command names to callables
+                with the signature `command(needle, search)`.
+            bind:
+                A callable that receives a fully qualified identifier, and
+                returns a callable with the signature `binding(context)`,
+                that retrieves the identifier value in the given context.
+        """
+        self.__bind = bind
+        self.__commands = {"__builtins__": {}}
+        for name, command in commands.items():
+            self.__commands[self.__command_name(name)] = command
+
+    def compile(self, tree, source="<genesis>"):
+        """Compile an expression parse tree to a Python callable."""
+        namespace = dict(self.__commands)
+        function = ast.parse("lambda context: None", mode="eval")
+        function.body.body = self.__lower(tree, namespace)
+        ast.fix_missing_locations(function)
+        code = compile(function, source, "eval")
+        return eval(code, namespace)  # pylint: disable=eval-used
+
+    @staticmethod
+    def __command_name(name):
+        """Retrieve the name of a command in the compiled code namespace."""
+        return "_command_%s" % name
+
+    def __lower(self, node, namespace):
+        """Translate a parse tree node to a Python `ast` node."""
+        kind = node[0]
+        if kind == parsetree.LITERAL:
+            return ast.Constant(value=node[1])
+        if kind == parsetree.IDENTIFIER:
+            binding = "_binding_%d" % len(namespace)
+            namespace[binding] = self.__bind(node[1])
+            return ast.Call(
+                func=ast.Name(id=binding, ctx=ast.Load()),
+                args=[ast.Name(id="context", ctx=ast.Load())],
+                keywords=[],
+            )
+        if kind == parsetree.OPERATION:
+            _, oper, lhs, rhs = node
+            return ast.BinOp(
+                left=self.__lower(lhs, namespace),
+                op=ExpressionCompiler.binary_operators[oper](),
+                right=self.__lower(rhs, namespace),
+            )
+        if kind == parsetree.COMMAND:
+            _, cmdname, needle, search = node
+            command = ExpressionCompiler.__command_name(cmdname)
+            if command not in namespace:
+                raise Exception("Unexpected command: `%s`" % cmdname)
+            return ast.Call(
+                func=ast.Name(id=command, ctx=ast.Load()),
+                args=[
+                    self.__lower(needle, namespace),
+                    self.__lower(search, namespace),
+                ],
+                keywords=[],
+            )
+        if kind == parsetree.LIST:
+            return ast.Tuple(
+                elts=[ast.Constant(value=item) for item in node[1]],
+                ctx=ast.Load(),
+            )
+        raise Exception("Invalid parse tree node: `%s`." % kind)
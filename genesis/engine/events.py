@@ -19,28 +19,48 @@
 
 """Code related to game events."""
 
-from collections import defaultdict
-
 import logging
 
 logger = logging.getLogger("genesis_gds")
 
 
+class _SenderObject:  # pylint: disable=too-few-public-methods
+    """A `fake` object to act as a proxy sender for events."""
+
+
 class EventPublisher:
-    """An object that publishes events."""
+    """
+    An object that publishes events.
+
+    The observers are only stored once the first observer subscribes, as
+    many objects never have any.
+    """
+
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__observers",)
 
     def __init__(self):
         """Initialize publisher object."""
-        self.__observers = defaultdict(list)
+        self.__observers = None
 
     def subscribe(self, event, observer):
         """Register an observer object to an event name."""
-        if observer not in self.__observers[event]:
-            self.__observers[event].append(observer)
+        if self.__observers is None:
+            self.__observers = {}
+        observers = self.__observers.setdefault(event, [])
+        if observer not in observers:
+            observers.append(observer)
+
+    def has_observers(self, event):
+        """Check if any observer is registered to an event name."""
+        return bool(self.__observers and self.__observers.get(event))
 
     def emit(self, event):
         """Emit event notification to observer."""
-        for observer in self.__observers[event.event]:
+        if not self.__observers:
+            return
+        for observer in self.__observers.get(event.event, ()):
             logger.debug(
                 msg="Notifying event: %s to %s" % (event.name, observer.name)
             )
@@ -49,11 +69,7 @@ class EventPublisher:
     @staticmethod
     def sender_instance(**params):
         """Instantiate a `sener` object with the given parameters."""
-        # pylint: disable=too-few-public-methods
-        class SenderObject:
-            """A `fake` object to act as a proxy sender for events."""
-
-        sender = SenderObject()
+        sender = _SenderObject()
         for key, value in params.items():
             setattr(sender, key, value)
         return sender
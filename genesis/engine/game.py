@@ -20,18 +20,24 @@
 """Game engine internals."""
 
 import sys
+import bisect
 import logging
 import importlib
 from collections import defaultdict
 
 import pygame  # pylint: disable=import-error
 
-from genesis.errors import ClassNotFoundError
+from genesis.errors import ClassNotFoundError, ScriptError
 from genesis.behavior.basic import Drawable
+from genesis.behavior.collision import Collider
 from genesis.engine.screen import Screen
 from genesis.engine.interpreter import GenesisIntepreter
 from genesis.engine.events import EventPublisher, GameEvent
-
+from genesis.engine.actions import compile_actions
+from genesis.engine.pool import ObjectPool
+from genesis.engine.broadphase import create_broadphase
+from genesis.engine.generators import is_generator, generate
+from genesis.objects import create_object_class
 
 logger = logging.getLogger("genesis_gds")
 
@@ -58,10 +64,24 @@ class GameScript:
 
 
 class Game:
+    # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """Class game."""
 
     def __init__(self, script, **options):
-        """Initialize object."""
+        """
+        Initialize object.
+
+        Options:
+            fps:
+                Maximum number of game loop cycles per second.
+            batch_events:
+                If True, events emitted while objects are updated are
+                queued, and handled at the end of the update, grouped by
+                object and event. The `when` guard of an action is
+                evaluated for a whole group at once. Only events with a
+                handler whose guard can be vectorized are queued, other
+                events are handled as they are emitted.
+        """
         logger.debug(
             msg="Game options:\n\t{}".format(
                 "\n\t".join(
@@ -72,19 +92,50 @@ class Game:
         self.__script = GameScript(script)
         self.__clock = pygame.time.Clock()
         self.__fps = options.get("fps", 30)
+        self.__batch_events = options.get("batch_events", False)
+        self.__pending_events = None
+        self.__batched_handlers = set()
         self.__game_classes = {}
         self.__levels = []
         self.event_handlers = defaultdict(dict)
         self.screen = self.__create_screen()
-        self.game_objects = [self.screen, self]
+        self.game_objects = []
+        self.__objects_by_name = {}
+        self.__names_version = 0
+        self.__added_objects = 0
+        self.__updatable_objects = []
+        self.__draw_order = []
+        # collidable objects, and the order they were added, in order.
+        self.__collidable_objects = {}
+        self.__dynamic_objects = []
+        # objects to remove at the end of the frame, in despawn order.
+        self.__despawned_objects = {}
+        self.__pools = {}
+        self.__broadphase = self.__create_broadphase()
+        self.__static_index = self.__create_broadphase()
         self.__name = "game"
+        self.add_object(self.screen)
+        self.add_object(self)
         self.interpreter = GenesisIntepreter(self)
 
-    def __create_screen(self,):
+    def __create_screen(
+        self,
+    ):
         default = {"width": 720, "height": 480}
         screen_info = self.__script.get("interface.screen", default)
         return Screen(**screen_info)
 
+    def __create_broadphase(self):
+        """
+        Create the collision broadphase configured in `game.collision`.
+
+        The broadphase is selected with `game.collision.broadphase`, and
+        the other `game.collision` attributes are the broadphase options.
+        """
+        options = dict(self.__script.get("game.collision") or {})
+        name = options.pop("broadphase", "spatial_hash")
+        return create_broadphase(name, **options)
+
     @property
     def current_game(self):
         """Retrieve game name."""
@@ -123,17 +174,13 @@ class Game:
 
     def run(self):
         """Run the game."""
-        self.__load_object_classes()
-        self.__levels = []
-        for level in self.__script.get("game.levels"):
-            for name, description in level.items():
-                self.__levels.append(Level(name, self, description))
+        self.load()
         for level in self.__levels:
             level.setup()
             level.start()
             while level.running:
                 self.__process_pygame_events()
-                self.__update_data()
+                self.step()
                 self.__draw_objects(self.screen)
                 self.__clock.tick(self.__fps)
             # TODO:
@@ -143,31 +190,69 @@ class Game:
         # else: player won the game.
         # otherwise, player lost the game.
 
+    @property
+    def levels(self):
+        """Retrieve the game levels, in order, after the game is loaded."""
+        return list(self.__levels)
+
+    def load(self):
+        """
+        Load game objects and levels, compiling all event handlers.
+
+        Every object, behavior and level is processed before reporting
+        errors, so that all errors in the script are reported together,
+        with a ScriptError, before the game starts.
+        """
+        errors = []
+        try:
+            self.__load_object_classes()
+        except ScriptError as error:
+            errors.extend(error.errors)
+        self.__levels = []
+        for level in self.__script.get("game.levels") or []:
+            for name, description in level.items():
+                try:
+                    self.__levels.append(Level(name, self, description))
+                except ScriptError as error:
+                    errors.extend(error.errors)
+        if errors:
+            raise ScriptError(errors)
+
     @staticmethod
     def __parse_behaviors(object_behaviors):
-        """Parse object_behaviors used by __looad_object_classes()."""
+        """
+        Parse object_behaviors used by __looad_object_classes().
+
+        Returns a tuple (classes, events, parameters, errors), where
+        `errors` is the list of behavior classes that could not be loaded.
+        """
         classes = []
         events = {}
         parameters = {}
+        errors = []
         for behavior in object_behaviors:
             classname = next(iter(behavior))
-            classes.append(Game.__load_class("%s" % classname))
+            try:
+                classes.append(Game.__load_class("%s" % classname))
+            except ClassNotFoundError as error:
+                errors.append(str(error))
             for attributes in [attr or {} for attr in behavior.values()]:
                 if attributes and "events" in attributes:
                     for event_description in attributes["events"]:
                         events.update(event_description)
                     del attributes["events"]
                 parameters.update(attributes)
-
-        return (classes, events, parameters)
+        return (classes, events, parameters, errors)
 
     def __load_object_classes(self):
         """Create game objects."""
         # TODO: document this method.
-        for object_item in self.__script.get("game.objects"):
+        errors = []
+        for object_item in self.__script.get("game.objects") or []:
             global_events = {}
             name = next(iter(object_item))
             behaviors = object_item[name]["behaviors"]
+            self.__create_pool(name, object_item[name])
             if "GameObject" not in behaviors:
                 behaviors.insert(
                     0,
@@ -178,87 +263,373 @@ class Game:
                         }
                     },
                 )
-            classes, events, parameters = Game.__parse_behaviors(behaviors)
+            classes, events, parameters, missing = Game.__parse_behaviors(
+                behaviors
+            )
+            errors.extend(missing)
+            errors.extend(self.__fold_parameters(name, parameters))
             global_events[name] = events
-            self.__game_classes[name] = (tuple(classes), parameters)
+            try:
+                object_class = create_object_class(name, classes)
+            except TypeError as error:
+                errors.append("%s: invalid behaviors: %s" % (name, error))
+            else:
+                self.__game_classes[name] = (object_class, parameters)
             for events in global_events.values():
                 for event_name, actions in events.items():
-                    self.add_event(name, event_name, actions)
+                    try:
+                        self.add_event(name, event_name, actions)
+                    except ScriptError as error:
+                        errors.extend(error.errors)
+        if errors:
+            raise ScriptError(errors)
+
+    def __create_pool(self, name, description):
+        """
+        Create the object pool for an object template.
+
+        If the object description has a `pool` attribute, up to that number
+        of destroyed objects are kept, and reused by the next spawns.
+        """
+        if description.get("pool"):
+            self.__pools[name] = ObjectPool(description["pool"])
+
+    def __fold_parameters(self, name, parameters):
+        """
+        Evaluate constant default parameters of an object template.
+
+        Parameters that are constant expressions (e.g. `screen.width - 50`)
+        or lists of them are evaluated once, when the template is loaded,
+        and the result is reused by every spawned object.
+
+        Returns the list of errors found while evaluating the parameters,
+        which are reported with the other errors in the script.
+        """
+        errors = []
+        for key, value in parameters.items():
+            try:
+                parameters[key] = self.__fold_value(value)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append("%s.%s: %s" % (name, key, error))
+        return errors
+
+    def __fold_value(self, value):
+        """Evaluate value, if it is a constant expression, or list of them."""
+        if isinstance(value, str):
+            if self.interpreter.is_constant(value):
+                value = self.interpreter.evaluate_expression(value)
+        elif isinstance(value, list):
+            value = [self.__fold_value(item) for item in value]
+        return value
 
     def add_event(self, object_name, name, actions):
-        """Add an event to the game event set."""
-        self.event_handlers[object_name].update({name: actions})
+        """
+        Add an event to the game event set.
+
+        The event actions are compiled, and a ScriptError is raised if
+        any of them is invalid.
+        """
+        where = "%s.%s" % (object_name, name)
+        compiled, errors = compile_actions(self.interpreter, actions, where)
+        if errors:
+            raise ScriptError(errors)
+        self.event_handlers[object_name].update({name: compiled})
+        if any(action.batched for action in compiled):
+            self.__batched_handlers.add((object_name, name))
+        else:
+            self.__batched_handlers.discard((object_name, name))
 
     def notify(self, event):
         """Receive object notification."""
         if event.sender.name in self.event_handlers:
             emitters = self.event_handlers[event.sender.name]
             if event.name in emitters:
+                if self.__pending_events is not None:
+                    key = (event.sender.name, event.name)
+                    if key in self.__batched_handlers:
+                        self.__pending_events[key].append(event)
+                        return
                 # NOTE: this could be in another thread!
                 for action in emitters[event.name]:
-                    self.execute_action(event.sender, action.copy(), event)
+                    self.execute_action(event.sender, action, event)
+
+    def __dispatch_pending_events(self):
+        """
+        Handle queued events, grouped by object and event name.
+
+        Events emitted while handling a group are queued and handled
+        before this method returns.
+        """
+        while self.__pending_events:
+            pending = self.__pending_events
+            self.__pending_events = defaultdict(list)
+            for (object_name, event_name), events in pending.items():
+                actions = self.event_handlers[object_name][event_name]
+                for action in actions:
+                    self.execute_batch(action, events)
+        self.__pending_events = None
+
+    def execute_batch(self, action, events):
+        """
+        Execute a compiled action for a group of events.
+
+        The action `when` guard is evaluated for all events at once, and
+        the statements are executed for the events where it holds.
+        """
+        logger.debug(msg="BATCH ACTION: {} x {}".format(action, len(events)))
+        scopes = [event.as_dict() for event in events]
+        if action.guard is None:
+            selected = [True] * len(scopes)
+        else:
+            selected = self.interpreter.evaluate_condition(action.when, scopes)
+        for event, scope, execute in zip(events, scopes, selected):
+            if execute:
+                self.execute_statements(
+                    event.sender, action.statements, **scope
+                )
 
     def tick(self):
         """Ensure game loop executes, at most, the configured times per sec."""
         self.__clock.tick(self.__fps)
 
     def execute_action(self, caller, action, event):
-        """Execute action code."""
+        """Execute a compiled action."""
         logger.debug(msg="ACTION: {}".format(action))
-        execute = True
-        statements = action["do"]
-        if isinstance(statements, str):
-            statements = [statements]
-        del action["do"]
         extra_args = event.as_dict()
-        if "when" in action:
-            logger.debug(msg="Evaluating `when`: {}".format(action["when"]))
-            execute = self.interpreter.evaluate_expression(
-                action["when"], **extra_args
-            )
-            del action["when"]
-        if execute:
-            self.execute_statements(caller, statements, **extra_args)
+        if action.guard is not None:
+            logger.debug(msg="Evaluating `when`: {}".format(action))
+            if not self.interpreter.evaluate(action.guard, extra_args):
+                return
+        self.execute_statements(caller, action.statements, **extra_args)
 
     def execute_statements(self, caller, statements, **scope):
-        """Execute the list of statements."""
+        """Execute the list of compiled statements."""
         scope["caller"] = caller
-        calls = None
-        for statement in statements:
+        for statement, calls in statements:
             logger.debug(msg="Executing statement: {}".format(statement))
-            if isinstance(statement, dict):
-                if len(statement) != 1:
-                    raise Exception("Multiple event action: " % statement)
-                statement, calls = next(iter(statement.items()))
             if calls:
-                if not isinstance(calls, list):
-                    calls = [calls]
                 for call in calls:
-                    call.update(**scope)
-                    self.interpreter.execute(statement, **call)
+                    self.interpreter.run_statement(statement, scope, call)
             else:
-                self.interpreter.execute(statement, **scope)
+                self.interpreter.run_statement(statement, scope)
+
+    def add_object(self, obj):
+        """
+        Add an object to the game.
+
+        The object is added to the object name index, and to the
+        registries of updatable, drawable and collidable objects, according
+        to its capabilities. Objects are updated and checked for collision
+        in the order they were added, and drawn in order of `z_index`,
+        and, for the same `z_index`, in the order they were added.
+        """
+        self.add_objects([obj])
+
+    def add_objects(self, objects):
+        """
+        Add many objects to the game, in order.
+
+        See `add_object()`. The drawing order is sorted only once, no
+        matter how many objects are added.
+        """
+        drawables = []
+        for obj in objects:
+            self.game_objects.append(obj)
+            instances = self.__objects_by_name.setdefault(obj.name, [])
+            if not instances:
+                self.__names_version += 1
+            instances.append(obj)
+            self.__added_objects += 1
+            if hasattr(obj, "update"):
+                self.__updatable_objects.append(obj)
+            if isinstance(obj, Drawable):
+                drawables.append((obj.z_index, self.__added_objects, obj))
+            if hasattr(obj, "should_collide"):
+                self.__collidable_objects[obj] = self.__added_objects
+                if obj.static:
+                    index = self.__static_index
+                else:
+                    index = self.__broadphase
+                    self.__dynamic_objects.append(obj)
+                index.insert(
+                    obj,
+                    self.__added_objects,
+                    obj.bounding_box,
+                    obj.layer,
+                    obj.mask,
+                )
+        if len(drawables) == 1:
+            bisect.insort(self.__draw_order, drawables[0])
+        elif drawables:
+            self.__draw_order.extend(drawables)
+            self.__draw_order.sort(key=lambda entry: entry[:2])
+
+    def remove_object(self, obj):
+        """Remove an object from the game, and from all object registries."""
+        self.remove_objects([obj])
+
+    def remove_objects(self, objects):
+        """
+        Remove many objects from the game, and from all object registries.
+
+        Every registry is traversed only once, no matter how many objects
+        are removed. Objects should not be removed while the game objects
+        are updated, use `despawn()` instead.
+        """
+        removed = set(objects)
+        for obj in objects:
+            if hasattr(obj, "should_collide"):
+                obj.end_contacts()
+        for obj in removed:
+            if hasattr(obj, "should_collide"):
+                self.__collidable_objects.pop(obj, None)
+                if obj.static:
+                    self.__static_index.remove(obj)
+                else:
+                    self.__broadphase.remove(obj)
+        for name in {obj.name for obj in removed}:
+            instances = self.__objects_by_name[name]
+            if instances[0] in removed:
+                self.__names_version += 1
+            instances = [obj for obj in instances if obj not in removed]
+            if instances:
+                self.__objects_by_name[name] = instances
+            else:
+                del self.__objects_by_name[name]
+        for registry in (
+            self.game_objects,
+            self.__updatable_objects,
+            self.__dynamic_objects,
+        ):
+            registry[:] = [obj for obj in registry if obj not in removed]
+        self.__draw_order = [
+            entry for entry in self.__draw_order if entry[2] not in removed
+        ]
+
+    def despawn(self, obj):
+        """
+        Remove a spawned object from the game, at the end of the frame.
+
+        The object is updated, drawn and checked for collisions until the
+        current frame ends. Objects in contact with it emit
+        `collision_exit` when it is removed. If the object template has a
+        pool, the object is kept in the pool to be reused.
+
+        Scripts remove objects with the object `destroy` action, which
+        calls this method.
+        """
+        self.__despawned_objects.setdefault(obj)
+
+    def __release_despawned_objects(self):
+        """Remove despawned objects from the game, returning them to pools."""
+        if not self.__despawned_objects:
+            return
+        despawned = list(self.__despawned_objects)
+        self.__despawned_objects = {}
+        self.remove_objects(despawned)
+        for obj in despawned:
+            pool = self.__pools.get(obj.name)
+            if pool is not None:
+                pool.release(obj)
+
+    def pool_info(self):
+        """Retrieve the statistics of every object pool, by template name."""
+        return {name: pool.info() for name, pool in self.__pools.items()}
+
+    @property
+    def updatable_objects(self):
+        """Retrieve the objects updated on every frame, in update order."""
+        return self.__updatable_objects
+
+    @property
+    def drawable_objects(self):
+        """Retrieve the drawable objects, in drawing order."""
+        return [obj for _, _, obj in self.__draw_order]
+
+    @property
+    def collidable_objects(self):
+        """Retrieve the objects that might collide, in the order added."""
+        return list(self.__collidable_objects)
+
+    @property
+    def broadphase(self):
+        """
+        Retrieve the collision broadphase.
+
+        The broadphase, selected in the script with
+        `game.collision.broadphase`, has all collidable objects that are
+        not static, and is updated with every object bounding box after
+        all objects are updated, when collisions are detected. See
+        `genesis.engine.broadphase.create_broadphase()`.
+        """
+        return self.__broadphase
+
+    def build_static_index(self):
+        """
+        Build the index of static collidable objects.
+
+        The index is built when a level is set up, and uses the same kind
+        of broadphase of `broadphase`. Static objects added afterwards are
+        inserted in the index, and objects that are not static query the
+        index for collisions, so pairs of static objects are never tested.
+        Objects are ordered by the order they were added to the game, as
+        in `broadphase`.
+        """
+        self.__static_index = self.__create_broadphase()
+        for obj, order in self.__collidable_objects.items():
+            if obj.static:
+                self.__static_index.insert(
+                    obj, order, obj.bounding_box, obj.layer, obj.mask
+                )
+
+    def move_static(self, obj):
+        """Update the static index after a static object is moved."""
+        self.__static_index.move(obj, obj.bounding_box)
 
     def get_object_value(self, name):
         """Return a `value` for an item."""
-        obj, *parts = name.split(".")
-        for value in self.game_objects:
-            if value.name == obj:
-                for part in parts:
-                    if hasattr(value, part):
-                        value = getattr(value, part)
-                    else:
-                        raise Exception("Invalid member name: `%s`" % name)
-                return value
-        raise Exception("Invalid object: `%s`" % name)
+        _, *parts = name.split(".")
+        value = self.get_object(name)
+        for part in parts:
+            if hasattr(value, part):
+                value = getattr(value, part)
+            else:
+                raise Exception("Invalid member name: `%s`" % name)
+        return value
 
     def get_object(self, name):
         """Return a `value` for an item."""
-        obj, *_ = name.split(".")
-        for value in self.game_objects:
-            if value.name == obj:
-                return value
-        raise Exception("Invalid object: `%s`" % name)
+        value = self.find_object(name)
+        if value is None:
+            raise Exception("Invalid object: `%s`" % name)
+        return value
+
+    def find_object(self, name):
+        """
+        Return the object for a name, or None, if there is no object.
+
+        Spawned objects are named after their template, so many objects
+        might share a name. In this case, the object added to the game
+        first, which is still in the game, is returned.
+        """
+        instances = self.__objects_by_name.get(name.split(".", 1)[0])
+        return instances[0] if instances else None
+
+    @property
+    def names_version(self):
+        """
+        Retrieve the version of the object name index.
+
+        The version changes every time the object returned by
+        `find_object()` for a name might change, that is, when the first
+        object with a name is added, or the first object with a name is
+        removed.
+        """
+        return self.__names_version
+
+    def find_objects(self, name):
+        """Return all objects with a name, in the order they were added."""
+        return list(self.__objects_by_name.get(name.split(".", 1)[0], ()))
 
     def __process_pygame_events(self):  # pylint: disable=no-self-use
         """Process game events."""
@@ -268,40 +639,131 @@ class Game:
             else:
                 pass
 
-    def __update_data(self):
-        """Update data for game objects."""
-        for gameobj in self.game_objects:
-            if hasattr(gameobj, "update"):
-                gameobj.update()
+    def step(self):
+        """
+        Advance the game by a single frame, without drawing it.
+
+        All objects are updated, collisions are detected, and the events
+        emitted are handled.
+        """
+        if self.__batch_events:
+            self.__pending_events = defaultdict(list)
+        for gameobj in self.__updatable_objects:
+            gameobj.update()
+        self.__detect_collisions()
+        if self.__batch_events:
+            self.__dispatch_pending_events()
+        self.__release_despawned_objects()
+
+    def __detect_collisions(self):
+        """
+        Detect the collisions among all collidable objects.
+
+        Run once per frame, after all objects are updated, so each pair of
+        objects is tested once, with the objects at their final positions.
+        Pairs are selected by the broadphase, and tested in the order the
+        objects were added to the game, so results are deterministic.
+        Contacts that ended are reported after all pairs are tested.
+        """
+        boxes = {obj: obj.bounding_box for obj in self.__dynamic_objects}
+        self.__broadphase.update(self.__dynamic_objects, boxes.__getitem__)
+        pairs = [
+            (obj, other)
+            for obj, other in self.__broadphase.pairs()
+            if obj.should_collide or other.should_collide
+        ]
+        if len(self.__static_index) > 0:
+            pairs.extend(self.__static_pairs(boxes))
+        for obj, other, point, angle in Collider.detect_collisions(pairs):
+            obj.make_contact(other, point, angle)
+        for obj in self.__collidable_objects:
+            obj.update_contacts()
+
+    def __static_pairs(self, boxes):
+        """
+        Retrieve the pairs of objects and static objects that might collide.
+
+        The pairs are selected by querying the static index with the
+        bounding `boxes` of the objects that are not static.
+        """
+        static_index = self.__static_index
+        return [
+            (obj, other)
+            for obj, box in boxes.items()
+            for other in static_index.query(box, obj.layer, obj.mask)
+            if obj.should_collide or other.should_collide
+        ]
 
     def __draw_objects(self, screen):
         """Draw game objects."""
         screen.clear()
-        for gameobj in self.game_objects:
-            if isinstance(gameobj, Drawable):
-                gameobj.draw(screen)
+        for _, _, gameobj in self.__draw_order:
+            gameobj.draw(screen)
         screen.update()
 
-    def spawn(self, object_name, **parameters):
-        """Spawn a new object."""
-        # TODO: document this method.
-        def constructor(self, **options):
-            for superclass in classes:
-                superclass.__init__(self, **options)
-
+    def spawn(self, object_name, count=None, **parameters):
+        """
+        Spawn a new object, and return it.
+
+        The object is an instance of the class created for the object
+        template `object_name` when the script was loaded, initialized
+        with the template default parameters, updated with `parameters`.
+        If the template has a pool with a released object, the object is
+        reset, with `reset()`, and reused.
+
+        If `count` is given, `count` objects are spawned at once, with
+        `spawn_many()`, and the list of objects is returned. As `count`
+        is reserved, it is never passed to the objects, so templates
+        should not use a parameter named `count`.
+        """
+        if count is not None:
+            return self.spawn_many(object_name, count, **parameters)
+        return self.spawn_many(object_name, 1, **parameters)[0]
+
+    def spawn_many(self, object_name, count, **parameters):
+        """
+        Spawn `count` objects of the same template, and return them.
+
+        Parameters might be generators, as described in
+        `genesis.engine.generators`, creating a different value for
+        each object. All objects are added to the game at once.
+        """
         if object_name not in self.__game_classes:
             raise Exception("Cannot find object `%s` to spawn." % object_name)
+        if not isinstance(count, int) or count < 1:
+            raise Exception(
+                "Invalid count to spawn `%s`: %s" % (object_name, count)
+            )
 
-        classes, default_parameters = self.__game_classes[object_name]
+        object_to_spawn, default_parameters = self.__game_classes[object_name]
         start_values = default_parameters.copy()
         start_values.update(parameters)
-        object_to_spawn = type(object_name, classes, {"__init__": constructor})
         start_values.update({"name": object_name, "game": self})
-        obj = object_to_spawn(**start_values)
-        self.game_objects.append(obj)
-        object_handlers = self.event_handlers.get(object_name, {})
-        for event in object_handlers.keys():
+        generated = {
+            key: generate(value, count)
+            for key, value in start_values.items()
+            if is_generator(value)
+        }
+        objects = []
+        for index in range(count):
+            for key, values in generated.items():
+                start_values[key] = values[index]
+            objects.append(self.__create_object(object_to_spawn, start_values))
+        self.add_objects(objects)
+        return objects
+
+    def __create_object(self, object_class, start_values):
+        """Create an object, or reuse one from the template pool."""
+        object_name = start_values["name"]
+        pool = self.__pools.get(object_name)
+        obj = pool.acquire() if pool is not None else None
+        if obj is not None:
+            obj.reset(**start_values)
+            return obj
+        obj = object_class(**start_values)
+        for event in self.event_handlers.get(object_name, ()):
             obj.subscribe(event, self)
+        return obj
 
     @staticmethod
     def __load_class(classname):
@@ -319,7 +781,16 @@ class Game:
 
 
 class Level(EventPublisher):
-    """A level in a game."""
+    """
+    A level in a game.
+
+    Errors in the handlers of the events emitted by levels, listed in
+    `EVENTS`, are reported with a ScriptError. Handlers of other events
+    are never executed by the engine, so their errors are only logged as
+    warnings, and the handlers are ignored.
+    """
+
+    EVENTS = ("start",)
 
     def __init__(self, name, game, events):
         """Initialize the level object."""
@@ -327,10 +798,23 @@ class Level(EventPublisher):
         self.__name = name
         self.__running = True
         self.game = game
+        errors = []
         for event in events:
             for event_name, actions in event.items():
-                self.game.add_event(name, event_name, actions)
+                try:
+                    self.game.add_event(name, event_name, actions)
+                except ScriptError as error:
+                    if event_name in Level.EVENTS:
+                        errors.extend(error.errors)
+                    else:
+                        logger.warning(
+                            msg="Ignoring level event `{}`: {}".format(
+                                event_name, "; ".join(error.errors)
+                            )
+                        )
                 self.subscribe(event_name, self.game)
+        if errors:
+            raise ScriptError(errors)
 
     @property
     def name(self):
@@ -339,6 +823,7 @@ class Level(EventPublisher):
 
     def setup(self):
         """Configure level."""
+        self.game.build_static_index()
 
     def start(self):
         """Start level."""
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""
+Parameter generators, used to spawn many objects at once.
+
+A generator is described, in the game script, by a dict with a single
+generator name, and its arguments:
+    range: [start, stop]
+        Values evenly spaced from `start` (inclusive) to `stop`
+        (exclusive).
+    grid: {columns: n, origin: [x, y], spacing: [dx, dy]}
+        Positions `[x, y]` filling a grid, row by row.
+    random: [low, high]
+        Random values between `low` and `high`. If both are integers,
+        the values are integers.
+    choice: [value, ...]
+        Random values chosen from a list.
+
+Random generators accept an optional `seed`, so the values can be
+reproduced. A list with generators, like `position: [{range: [0, 600]},
+200]`, generates lists.
+"""
+
+import random
+
+
+def is_generator(value):
+    """Check if a parameter value is, or contains, a generator."""
+    if isinstance(value, dict):
+        return len(value.keys() & _GENERATORS.keys()) == 1
+    if isinstance(value, list):
+        return any(is_generator(item) for item in value)
+    return False
+
+
+def generate(value, count):
+    """Generate `count` values for a parameter value."""
+    if isinstance(value, dict) and is_generator(value):
+        (name,) = value.keys() & _GENERATORS.keys()
+        try:
+            return _GENERATORS[name](value, count)
+        except (TypeError, ValueError, KeyError) as error:
+            raise Exception(
+                "Invalid `%s` generator: %s (%s)" % (name, value, error)
+            ) from error
+    if isinstance(value, list) and is_generator(value):
+        columns = [generate(item, count) for item in value]
+        return [list(items) for items in zip(*columns)]
+    return [value] * count
+
+
+def _generate_range(value, count):
+    """Generate values evenly spaced in a range."""
+    start, stop = value["range"]
+    if count < 1:
+        raise ValueError("cannot generate %s values" % count)
+    step = (stop - start) / count
+    return [start + index * step for index in range(count)]
+
+
+def _generate_grid(value, count):
+    """Generate positions filling a grid, row by row."""
+    grid = value["grid"]
+    columns = grid["columns"]
+    if not isinstance(columns, int) or columns < 1:
+        raise ValueError("`columns` must be a positive integer")
+    x, y = grid.get("origin", (0, 0))  # pylint: disable=invalid-name
+    delta_x, delta_y = grid.get("spacing", (1, 1))
+    return [
+        [x + (index % columns) * delta_x, y + (index // columns) * delta_y]
+        for index in range(count)
+    ]
+
+
+def _generate_random(value, count):
+    """Generate random values in an interval."""
+    low, high = value["random"]
+    rng = random.Random(value.get("seed"))
+    if isinstance(low, int) and isinstance(high, int):
+        return [rng.randint(low, high) for _ in range(count)]
+    return [rng.uniform(low, high) for _ in range(count)]
+
+
+def _generate_choice(value, count):
+    """Generate values randomly chosen from a list."""
+    choices = value["choice"]
+    rng = random.Random(value.get("seed"))
+    return [rng.choice(choices) for _ in range(count)]
+
+
+_GENERATORS = {
+    "range": _generate_range,
+    "grid": _generate_grid,
+    "random": _generate_random,
+    "choice": _generate_choice,
+}
@@ -1,12 +1,114 @@
 """blah."""
 
-import tokenize
-from io import StringIO
+from collections import OrderedDict, ChainMap
+import threading
 import operator
 import logging
 
+from genesis.engine.parsetree import (
+    LITERAL,
+    IDENTIFIER,
+    OPERATION,
+    COMMAND,
+    LIST,
+    STATEMENT,
+)
+from genesis.engine.compiler import ExpressionCompiler
+from genesis.engine.bindings import Binding
+from genesis.engine import lexer
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # pylint: disable=invalid-name
+
 log = logging.getLogger("genesis")
 
+# Marker for values not found, when None is a valid value.
+_MISSING = object()
+
+
+class ParseCache:
+    """
+    A bounded LRU cache for parsed statements and expressions.
+
+    Parse trees are keyed by the kind of parse (statement or expression)
+    and the source text, as the same source might be valid for one and
+    not for the other. The number of cache hits and misses is available
+    through `hits` and `misses`.
+
+    The cache might be shared by many threads.
+    """
+
+    def __init__(self, maxsize=256):
+        """Initialize the cache, holding, at most, `maxsize` entries."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        """Retrieve the number of cached entries."""
+        return len(self.__entries)
+
+    def get(self, key, parse):
+        """
+        Retrieve the cached parse tree for key.
+
+        If `key` is not in the cache, `parse()` is called to create the
+        tree, which is stored for future use. If the cache is full, the
+        least recently used entry is discarded.
+        """
+        with self.__lock:
+            tree = self.__entries.get(key, _MISSING)
+            if tree is not _MISSING:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return tree
+            self.misses += 1
+        # parse outside the lock, as parsing might be slow.
+        tree = parse()
+        with self.__lock:
+            self.__entries[key] = tree
+            if len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+        return tree
+
+    def clear(self):
+        """Remove all entries from the cache, and reset counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Retrieve cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.__entries),
+            "maxsize": self.maxsize,
+        }
+
+
+class EvaluationContext:
+    # pylint: disable=too-few-public-methods
+    """
+    The state of a single statement execution, or expression evaluation.
+
+    Every execution uses its own context, so an interpreter can be used by
+    nested evaluations, or by many threads, at the same time. The `scope`
+    is a ChainMap, so scopes are layered instead of copied, with the first
+    one having precedence.
+    """
+
+    __slots__ = ("scope",)
+
+    def __init__(self, *scopes):
+        """Initialize the context with the given, layered, scopes."""
+        self.scope = ChainMap(*scopes)
+
 
 class GenesisIntepreter:
     """Genesis Game Design Engine language interpreter."""
@@ -38,11 +140,49 @@ class GenesisIntepreter:
         "in": "_unexpected_command",
     }
 
-    def __init__(self, game):
-        """Initialize interpreter."""
+    # Evaluation modes.
+    COMPILED = "compiled"
+    REFERENCE = "reference"
+
+    def __init__(self, game, cache_size=256, mode=COMPILED):
+        """
+        Initialize interpreter.
+
+        Parameters:
+            game:
+                The game the interpreter executes statements for.
+            cache_size:
+                The maximum number of parsed statements and expressions
+                kept in the parse cache.
+            mode:
+                If `GenesisIntepreter.COMPILED`, expressions are compiled
+                to Python code before evaluation. If
+                `GenesisIntepreter.REFERENCE`, expressions are evaluated by
+                walking the parse tree.
+        """
+        if mode not in (
+            GenesisIntepreter.COMPILED,
+            GenesisIntepreter.REFERENCE,
+        ):
+            raise Exception("Invalid interpreter mode: `%s`" % mode)
         self.__game = game
-        self.tokenizer = None
-        self.__scope = None
+        self.__mode = mode
+        self.parse_cache = ParseCache(cache_size)
+        self.__bindings = {}
+        self.__compiler = ExpressionCompiler(
+            {"all": self._parse_command_all, "any": self._parse_command_any},
+            self.__binding,
+        )
+
+    @property
+    def mode(self):
+        """
+        Retrieve the interpreter evaluation mode.
+
+        The mode is fixed when the interpreter is created, as compiled
+        statements and expressions are cached.
+        """
+        return self.__mode
 
     @staticmethod
     def as_number(value):
@@ -88,42 +228,301 @@ class GenesisIntepreter:
 
         If the statement is no an assignment, it is considered an expression.
         """
-        self.__scope = scope.copy()
-        with StringIO(statement) as stream:
-            self.tokenizer = tokenize.generate_tokens(stream.readline)
-            # identifier
-            next_token = self.__next_token()
-            next_token, identifier = self.__parse_identifier(next_token)
-            # assign expression
-            next_token, assignment = self.__parse_assignment(next_token)
-            if next_token[0] != tokenize.ENDMARKER:
-                raise Exception("Invalid statement: `%s`" % statement)
-            if assignment:
-                object_ref, member_name = self.__get_reference(identifier)
-                oper, value = assignment
-                original = getattr(object_ref, member_name)
-                setattr(
-                    object_ref,
-                    member_name,
-                    GenesisIntepreter.assignment_ops[oper](original, value),
-                )
-            else:
-                value = self.__get_object_property(identifier)
-            self.tokenizer = None
-            return value
+        return self.run_statement(self.compile_statement(statement), scope)
 
     def evaluate_expression(self, expression, **scope):
         """Evaluate an expression, with the statement parser."""
-        self.__scope = scope.copy()
-        with StringIO(expression) as stream:
-            self.tokenizer = tokenize.generate_tokens(stream.readline)
-            token, value = self.__parse_expression(self.__next_token())
-            if token[0] != tokenize.ENDMARKER:
-                raise Exception("Invalid expression: `%s`" % expression)
-            self.tokenizer = None
-            return value
+        return self.evaluate(self.compile_expression(expression), scope)
+
+    def run_statement(self, statement, *scopes):
+        """
+        Execute a statement created with `compile_statement()`.
+
+        Each one of `scopes` is a mapping of variables, as the keyword
+        arguments described in `execute()`. Scopes are layered, and are
+        searched in order, so no scope is ever copied or modified.
+        """
+        identifier, oper, expression = statement
+        context = EvaluationContext(*scopes)
+        if oper:
+            value = expression(context)
+            object_ref, member_name = self.__get_reference(identifier, context)
+            original = getattr(object_ref, member_name)
+            setattr(
+                object_ref,
+                member_name,
+                GenesisIntepreter.assignment_ops[oper](original, value),
+            )
+        else:
+            value = self.__binding(identifier)(context)
+        return value
+
+    def evaluate(self, expression, *scopes):
+        """
+        Evaluate an expression created with `compile_expression()`.
+
+        See `run_statement()` for the description of `scopes`.
+        """
+        return expression(EvaluationContext(*scopes))
+
+    def parse_expression(self, expression):
+        """
+        Retrieve the parse tree for an expression.
+
+        Parse trees are cached, so an expression is only parsed once.
+        """
+        return self.parse_cache.get(
+            ("expression", expression),
+            lambda: Parser(expression).expression(),
+        )
+
+    def compile_statement(self, statement):
+        """
+        Compile an action statement, so it can be executed many times.
+
+        The result is a tuple `(identifier, assignment_operator, expression)`,
+        to be used with `run_statement()`. If the statement is not an
+        assignment, both `assignment_operator` and `expression` are None.
+        Compiled statements are cached.
+        """
+
+        def compile_source():
+            _, identifier, assignment = Parser(statement).statement()
+            if assignment is None:
+                return (identifier, None, None)
+            oper, tree = assignment
+            return (identifier, oper, self.__compile_tree(tree, statement))
+
+        return self.parse_cache.get(
+            ("compiled statement", statement), compile_source
+        )
+
+    def compile_expression(self, expression):
+        """
+        Compile an expression, so it can be evaluated many times.
+
+        The result is to be used with `evaluate()`. Compiled expressions
+        are cached.
+        """
+        return self.parse_cache.get(
+            ("compiled expression", expression),
+            lambda: self.__compile_tree(
+                Parser(expression).expression(), expression
+            ),
+        )
+
+    def vector_identifiers(self, expression):
+        """
+        Retrieve the identifiers of a condition that can be vectorized.
+
+        A condition can be evaluated for many scopes at once, with NumPy,
+        if it only uses numbers, identifiers and arithmetic. Returns the
+        tuple of identifiers used by the condition, or None if NumPy is not
+        available, or the condition cannot be vectorized. The result is
+        cached, so the parse tree is inspected only once.
+        """
+
+        def inspect():
+            identifiers = set()
+            tree = self.parse_expression(expression)
+            if numpy is None or not self.__is_numeric_node(tree, identifiers):
+                return None
+            return tuple(sorted(identifiers))
+
+        return self.parse_cache.get(
+            ("vector identifiers", expression), inspect
+        )
+
+    def evaluate_condition(self, expression, scopes):
+        """
+        Evaluate a condition expression once for each scope in `scopes`.
+
+        Returns a list of booleans, telling if the condition holds for each
+        scope. If the condition can be vectorized, as given by
+        `vector_identifiers()`, the value of each identifier is retrieved
+        for all scopes, and the condition is evaluated in a single pass,
+        with float arrays, if all values are floats, or object arrays, so
+        integer arithmetic is exact. If a value is not a number, or the
+        computation fails, the condition is evaluated for each scope with
+        the values already retrieved, so errors are reported as usual, and
+        no identifier is evaluated twice.
+        """
+        identifiers = self.vector_identifiers(expression)
+        if identifiers is None or len(scopes) < 2:
+            compiled = self.compile_expression(expression)
+            return [
+                bool(compiled(EvaluationContext(scope))) for scope in scopes
+            ]
+        tree = self.parse_expression(expression)
+        columns = {
+            identifier: self.__binding(identifier).values(scopes)
+            for identifier in identifiers
+        }
+        result = GenesisIntepreter.__evaluate_vector(
+            tree, columns, len(scopes)
+        )
+        if result is None:
+            result = GenesisIntepreter.__evaluate_rows(
+                tree, columns, len(scopes)
+            )
+        return result
+
+    def __is_numeric_node(self, node, identifiers):
+        """
+        Check if a parse tree node only uses numbers and arithmetic.
+
+        The identifiers found in the tree are added to `identifiers`.
+        """
+        kind = node[0]
+        if kind == LITERAL:
+            return isinstance(node[1], (int, float))
+        if kind == IDENTIFIER:
+            identifiers.add(node[1])
+            return True
+        if kind == OPERATION:
+            _, _, lhs, rhs = node
+            return self.__is_numeric_node(
+                lhs, identifiers
+            ) and self.__is_numeric_node(rhs, identifiers)
+        return False
+
+    @staticmethod
+    def __evaluate_vector(tree, columns, count):
+        """
+        Evaluate a numeric parse tree for many scopes at once.
+
+        `columns` maps each identifier to the list of its values. Returns
+        None if any value is not a number, or if the computation fails.
+        """
+        arrays = {}
+        for identifier, values in columns.items():
+            dtype = GenesisIntepreter.__column_type(values)
+            if dtype is None:
+                return None
+            arrays[identifier] = numpy.array(values, dtype=dtype)
+        try:
+            with numpy.errstate(all="raise"):
+                result = GenesisIntepreter.__evaluate_columns(tree, arrays)
+        except ArithmeticError:
+            return None
+        return numpy.broadcast_to(result != 0, (count,)).tolist()
+
+    @staticmethod
+    def __evaluate_rows(tree, columns, count):
+        """Evaluate a numeric parse tree for each scope, one at a time."""
+        result = []
+        for index in range(count):
+            row = {name: values[index] for name, values in columns.items()}
+            result.append(
+                bool(GenesisIntepreter.__evaluate_columns(tree, row))
+            )
+        return result
+
+    @staticmethod
+    def __column_type(values):
+        """
+        Retrieve the array type for a list of values.
+
+        Returns `float` if all values are floats, `object`, if all values
+        are numbers, and None otherwise.
+        """
+        dtype = float
+        for value in values:
+            if not isinstance(value, float):
+                if not isinstance(value, int):
+                    return None
+                dtype = object
+        return dtype
+
+    @staticmethod
+    def __evaluate_columns(node, columns):
+        """
+        Evaluate a numeric parse tree node, with the identifier values.
+
+        The values in `columns` might be arrays, or a single value.
+        """
+        kind = node[0]
+        if kind == LITERAL:
+            return node[1]
+        if kind == IDENTIFIER:
+            return columns[node[1]]
+        _, oper, lhs, rhs = node
+        return GenesisIntepreter.operations[oper](
+            GenesisIntepreter.__evaluate_columns(lhs, columns),
+            GenesisIntepreter.__evaluate_columns(rhs, columns),
+        )
+
+    def is_constant(self, expression):
+        """
+        Check if an expression always evaluates to the same value.
+
+        An expression is constant if it only uses literal numbers and
+        object properties listed in the object `constant_properties`.
+        """
+        try:
+            tree = self.parse_expression(expression)
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return self.__is_constant_node(tree)
+
+    def __is_constant_node(self, node):
+        """Check if a parse tree node always evaluates to the same value."""
+        kind = node[0]
+        if kind == LITERAL:
+            return True
+        if kind == OPERATION:
+            _, _, lhs, rhs = node
+            return self.__is_constant_node(lhs) and self.__is_constant_node(
+                rhs
+            )
+        if kind == IDENTIFIER:
+            objname, *member = node[1].split(".")
+            if len(member) != 1:
+                return False
+            obj = self.__game.find_object(objname)
+            return member[0] in getattr(obj, "constant_properties", ())
+        return False
+
+    def __compile_tree(self, tree, source):
+        """Create the evaluator for a parse tree, using interpreter mode."""
+        if self.__mode == GenesisIntepreter.REFERENCE:
+            return lambda context: self.__evaluate(tree, context)
+        return self.__compiler.compile(tree, source)
+
+    def __binding(self, identifier):
+        """Retrieve the, shared, binding for an identifier."""
+        binding = self.__bindings.get(identifier)
+        if binding is None:
+            binding = self.__bindings.setdefault(
+                identifier, Binding(self.__game, identifier)
+            )
+        return binding
+
+    def __evaluate(self, node, context):
+        """Evaluate a parse tree node, walking its children."""
+        kind = node[0]
+        if kind == LITERAL:
+            return node[1]
+        if kind == IDENTIFIER:
+            return self.__binding(node[1])(context)
+        if kind == OPERATION:
+            _, oper, lhs, rhs = node
+            lhs = self.__evaluate(lhs, context)
+            rhs = self.__evaluate(rhs, context)
+            return GenesisIntepreter.operations[oper](lhs, rhs)
+        if kind == COMMAND:
+            _, cmdname, needle, search = node
+            cmd = getattr(self, GenesisIntepreter.commands[cmdname])
+            return cmd(
+                self.__evaluate(needle, context),
+                self.__evaluate(search, context),
+                __command__=cmdname,
+            )
+        if kind == LIST:
+            return node[1]
+        raise Exception("Invalid parse tree node: `%s`." % kind)
 
-    def __get_reference(self, identifier):
+    def __get_reference(self, identifier, context):
         """
         Retrieve a reference to an identifier.
 
@@ -134,7 +533,7 @@ class GenesisIntepreter:
             objname = member[0]
             member = member[1:]
 
-        obj = self.__scope.get("caller")
+        obj = context.scope.get("caller")
         if obj is None:
             obj = self.__game.get_object(objname)
         if not member:
@@ -145,20 +544,88 @@ class GenesisIntepreter:
         error_msg = "Member reference not implemented: %s" % identifier
         raise NotImplementedError(error_msg)
 
+    # ---- language commands
+
+    def _parse_command_all(self, needle, search, **_):
+        """Evaluate command: `all <list> in <list>`."""
+        # pylint: disable=no-self-use
+        for value in needle:
+            if value not in search:
+                value = False
+                break
+        else:
+            value = True
+        return value
+
+    def _parse_command_any(self, needle, search, **_):
+        """Evaluate command: `any <list> in <list>`."""
+        # pylint: disable=no-self-use
+        for value in needle:
+            if value in search:
+                value = True
+                break
+        else:
+            value = False
+        return value
+
+    def _unexpected_command(self, *_args, **params):
+        """Raise an exception due to unexpected command found."""
+        # pylint: disable=no-self-use
+        raise Exception(
+            "Unexpected command: `%s`" % params.get("__command__", "UNKNOWN")
+        )
+
+
+class Parser:
+    """
+    Recursive-descent parser for the Genesis action language.
+
+    A parser object holds the state for parsing a single source text, and
+    creates its parse tree.
+    """
+
+    def __init__(self, source):
+        """Initialize the parser for the given source text."""
+        self.__source = source
+        self.__tokens = iter(lexer.tokenize(source))
+
+    def statement(self):
+        """
+        Parse the source as an action statement.
+
+        An `statement` has the grammar:
+            statement: identifier [assignment_expression]
+        """
+        # identifier
+        next_token = self.__next_token()
+        next_token, identifier = self.__parse_identifier(next_token)
+        # assign expression
+        next_token, assignment = self.__parse_assignment(next_token)
+        if next_token[0] != lexer.END:
+            raise Exception("Invalid statement: `%s`" % self.__source)
+        return (STATEMENT, identifier, assignment)
+
+    def expression(self):
+        """Parse the source as an expression."""
+        token, tree = self.__parse_expression(self.__next_token())
+        if token[0] != lexer.END:
+            raise Exception("Invalid expression: `%s`" % self.__source)
+        return tree
+
     def __parse_assignment(self, next_token):
         """
         Parse an assignment expression.
 
         As with all parser functions, it receives the next_token and return
-        a tuple (next_token, value). The value for an assignment expression
-        is a tuple (assignment_operator, value).
+        a tuple (next_token, node). The node for an assignment expression
+        is a tuple (assignment_operator, expression_node).
 
         The grammar for the assignment expression is:
             assignment_expression: [assignment_operator expression]
         """
         token, oper, *_ = next_token
         result = None
-        if token == tokenize.OP and oper in GenesisIntepreter.assignment_ops:
+        if token == lexer.OP and oper in GenesisIntepreter.assignment_ops:
             next_token, value = self.__parse_expression(self.__next_token())
             result = (oper, value)
         return next_token, result
@@ -171,7 +638,7 @@ class GenesisIntepreter:
             qualified_identifier : identifier [. identifier]*
         """
         qualified_id = []
-        while next_token[0] == tokenize.NAME:
+        while next_token[0] == lexer.NAME:
             if next_token[1] in GenesisIntepreter.commands:
                 if not qualified_id:  # it is a language command.
                     return self.__next_token(), next_token[1]
@@ -180,24 +647,24 @@ class GenesisIntepreter:
                 raise Exception(msg)
             qualified_id.append(next_token[1])
             next_token = self.__next_token()
-            if next_token[0] == tokenize.OP and next_token[1] == ".":
+            if next_token[0] == lexer.OP and next_token[1] == ".":
                 next_token = self.__next_token()
         return next_token, ".".join(qualified_id)
 
     @staticmethod
-    def __perform_operation(oper_rhs, lhs):
+    def __build_operation(oper_rhs, lhs):
         """
-        Ensure an operaton with the form `lhs operator rhs` is executed.
+        Build the node for an operaton with the form `lhs operator rhs`.
 
         `oper_rhs` is a tuple, containing an operator and the right hand side
-        value. `lhs` is the left hand side value. If `oper_rhs` is None, `lhs`
-        is returned as the result of the operation.
+        node. `lhs` is the left hand side node. If `oper_rhs` is None, `lhs`
+        is returned as the resulting node.
         """
-        value = lhs
+        node = lhs
         if oper_rhs is not None:
             operation, rhs = oper_rhs
-            value = GenesisIntepreter.operations[operation](lhs, rhs)
-        return value
+            node = (OPERATION, operation, lhs, rhs)
+        return node
 
     def __parse_expression(self, next_token):
         """
@@ -206,10 +673,10 @@ class GenesisIntepreter:
         Grammar:
             expression: term expression'
         """
-        next_token, value = self.__parse_term(next_token)
+        next_token, node = self.__parse_term(next_token)
         next_token, data = self.__parse_expression_prime(next_token)
-        value = GenesisIntepreter.__perform_operation(data, value)
-        return next_token, value
+        node = Parser.__build_operation(data, node)
+        return next_token, node
 
     def __parse_expression_prime(self, next_token):
         """
@@ -219,11 +686,11 @@ class GenesisIntepreter:
             expression': ["+|-" term expression']
         """
         token, oper, *_ = next_token
-        if token == tokenize.OP and oper in ["+", "-"]:
-            next_token, value = self.__parse_term(self.__next_token())
+        if token == lexer.OP and oper in ["+", "-"]:
+            next_token, node = self.__parse_term(self.__next_token())
             next_token, data = self.__parse_expression_prime(next_token)
-            value = GenesisIntepreter.__perform_operation(data, value)
-            return next_token, (oper, value)
+            node = Parser.__build_operation(data, node)
+            return next_token, (oper, node)
 
         return next_token, None
 
@@ -234,10 +701,10 @@ class GenesisIntepreter:
         Grammar:
             term: factor term'
         """
-        next_token, value = self.__parse_factor(next_token)
+        next_token, node = self.__parse_factor(next_token)
         next_token, data = self.__parse_term_prime(next_token)
-        value = GenesisIntepreter.__perform_operation(data, value)
-        return next_token, value
+        node = Parser.__build_operation(data, node)
+        return next_token, node
 
     def __parse_term_prime(self, next_token):
         """
@@ -247,11 +714,11 @@ class GenesisIntepreter:
             term': ["*|/|//|%" factor term']
         """
         token, oper, *_ = next_token
-        if token == tokenize.OP and oper in ["*", "/", "//", "%"]:
-            next_token, value = self.__parse_factor(self.__next_token())
+        if token == lexer.OP and oper in ["*", "/", "//", "%"]:
+            next_token, node = self.__parse_factor(self.__next_token())
             next_token, data = self.__parse_term_prime(next_token)
-            value = GenesisIntepreter.__perform_operation(data, value)
-            return next_token, (oper, value)
+            node = Parser.__build_operation(data, node)
+            return next_token, (oper, node)
         return next_token, None
 
     def __parse_factor(self, next_token):
@@ -261,10 +728,10 @@ class GenesisIntepreter:
         Grammar:
             factor: number factor'
         """
-        next_token, value = self.__parse_number(next_token)
+        next_token, node = self.__parse_number(next_token)
         next_token, data = self.__parse_factor_prime(next_token)
-        value = GenesisIntepreter.__perform_operation(data, value)
-        return next_token, value
+        node = Parser.__build_operation(data, node)
+        return next_token, node
 
     def __parse_factor_prime(self, next_token):
         """
@@ -274,11 +741,11 @@ class GenesisIntepreter:
             factor': ["**" number factor']
         """
         token, oper, *_ = next_token
-        if token == tokenize.OP and oper in ["**"]:
-            next_token, value = self.__parse_number(None)
+        if token == lexer.OP and oper in ["**"]:
+            next_token, node = self.__parse_number(self.__next_token())
             next_token, data = self.__parse_factor_prime(next_token)
-            value = GenesisIntepreter.__perform_operation(data, value)
-            return next_token, (oper, value)
+            node = Parser.__build_operation(data, node)
+            return next_token, (oper, node)
         return next_token, None
 
     def __parse_number(self, next_token):
@@ -289,95 +756,55 @@ class GenesisIntepreter:
             number: literal_number | "(" expression ")" | identifier
         """
         token, val, *_ = next_token
-        if token == tokenize.NUMBER:
-            value = GenesisIntepreter.as_number(val)
+        if token == lexer.NUMBER:
+            node = (LITERAL, GenesisIntepreter.as_number(val))
             next_token = self.__next_token()
-        elif token == tokenize.OP:
+        elif token == lexer.OP:
             if val == "(":
                 next_token = self.__next_token()
-                next_token, value = self.__parse_expression(next_token)
+                next_token, node = self.__parse_expression(next_token)
                 token, val, *_ = next_token
-                if token != tokenize.OP and val != ")":
+                if token != lexer.OP and val != ")":
                     raise Exception("Expected ')' got '%s'." % val)
                 next_token = self.__next_token()
             else:
                 raise Exception("Expected '(' got '%s'." % val)
-        elif token == tokenize.NAME:
-            next_token, value = self.__get_value_from_name(next_token)
+        elif token == lexer.NAME:
+            next_token, node = self.__parse_name(next_token)
         else:
             raise Exception("Invalid element `%s`." % val)
-        return next_token, value
+        return next_token, node
 
-    def __get_value_from_name(self, next_token):
+    def __parse_name(self, next_token):
         """
-        Return the value for a parsed fully qualified identifier.
+        Parse a fully qualified identifier.
 
-        If the identifier parsed is a language command, return the result of
-        its execution.
+        If the identifier parsed is a language command, return the node
+        for the command.
         """
         # TODO: Currently only parsing properties, could also parse methods.
         next_token, qualified_id = self.__parse_identifier(next_token)
         if qualified_id in GenesisIntepreter.commands:
-            cmdname = GenesisIntepreter.commands[qualified_id]
-            cmd = getattr(self, cmdname)
-            next_token, value = cmd(next_token, __command__=qualified_id)
+            next_token, node = self.__parse_command(next_token, qualified_id)
         else:
-            value = self.__get_object_property(qualified_id)
-        return next_token, value
+            node = (IDENTIFIER, qualified_id)
+        return next_token, node
 
     def __next_token(self):
         """Retrieve the next token."""
-        try:
-            token = next(self.tokenizer)
-            while token[0] == tokenize.NEWLINE:
-                token = next(self.tokenizer)
-            return token
-        except Exception:  # pylint: disable=broad-except
-            return None
-
-    def __get_object_property(self, identifier):
-        """Retrieve the value of an object property."""
-        value = None
-        try:
-            value = self.__game.get_object_value(identifier)
-        except Exception:  # pylint: disable=broad-except
-            try:
-                object_ref, member_name = self.__get_reference(identifier)
-                if self.__scope.get("name") == object_ref:
-                    value = self.__scope.get(member_name)
-                elif hasattr(object_ref, member_name):
-                    value = getattr(object_ref, member_name)(**self.__scope)
-                elif hasattr(self.__game, member_name):
-                    value = getattr(self.__game, member_name)(**self.__scope)
-                else:
-                    value = self.__get_value_from_local_scope(identifier)
-            except Exception:  # pylint: disable=broad-except
-                value = self.__get_value_from_local_scope(identifier)
-        return value
-
-    def __get_value_from_local_scope(self, identifier):
-        """Retrieve value for a fully qualified name from local scope."""
-        data = self.__scope.copy()
-        parts = identifier.split(".")
-        if self.__scope.get("name") == parts[0]:
-            parts = parts[1:]
-        for part in parts:
-            if part not in data:
-                raise Exception("Could not find value for `%s`" % identifier)
-            data = data[part]
-        return data
+        return next(self.__tokens, lexer.END_TOKEN)
 
     def __parse_list(self, next_token):
         """Parse a list of itens. ("(items...)" or "[items...]")."""
-        if next_token[0] == tokenize.OP and next_token[1] in ("(", "["):
+        if next_token[0] == lexer.OP and next_token[1] in ("(", "["):
             close_list = ")" if next_token[1] == "(" else "]"
             #
             list_of_items = []
             next_token = self.__next_token()
-            while next_token[0] == tokenize.NAME:
+            while next_token[0] == lexer.NAME:
                 list_of_items.append(next_token[1])
                 next_token = self.__next_token()
-                if next_token[0] == tokenize.OP:
+                if next_token[0] == lexer.OP:
                     if next_token[1] == ",":
                         next_token = self.__next_token()
                     elif next_token[1] == close_list:
@@ -387,7 +814,7 @@ class GenesisIntepreter:
                             "Invalid list separator: '%s'." % next_token[1]
                         )
 
-            if next_token[0] != tokenize.OP and next_token[1] != close_list:
+            if next_token[0] != lexer.OP and next_token[1] != close_list:
                 msg = "Expected `%s`, got `%s`." % (close_list, next_token[1])
                 raise Exception(msg)
             next_token = self.__next_token()
@@ -395,13 +822,13 @@ class GenesisIntepreter:
             msg = "Expected `list of items`, found `%s`" % next_token[1]
             raise Exception(msg)
 
-        return next_token, list_of_items
+        return next_token, (LIST, list_of_items)
 
     @staticmethod
     def __assert_identifier(token, expected=None):
         """Assert that an identifier parsed has the expected value."""
         token_type, val, *_ = token
-        if token_type != tokenize.NAME:
+        if token_type != lexer.NAME:
             raise Exception("Expected identifier. Got `%s`." % val)
         if expected and val != expected:
             raise Exception(
@@ -416,12 +843,12 @@ class GenesisIntepreter:
         grammar:
             list_of_values: "(" item [, item]* ")" | identifier
         """
-        if next_token[0] == tokenize.NAME:
+        if next_token[0] == lexer.NAME:
             next_token, identifier = self.__parse_identifier(next_token)
-            items = self.__get_object_property(identifier)
+            node = (IDENTIFIER, identifier)
         else:
-            next_token, items = self.__parse_list(next_token)
-        return next_token, items
+            next_token, node = self.__parse_list(next_token)
+        return next_token, node
 
     def __parse_list_in_list(self, next_token):
         """
@@ -431,38 +858,19 @@ class GenesisIntepreter:
             list_in_list: list_of_values "in" list_of_values
         """
         next_token, items = self.__parse_object_property_or_list(next_token)
-        GenesisIntepreter.__assert_identifier(next_token, "in")
+        Parser.__assert_identifier(next_token, "in")
         next_token = self.__next_token()
         next_token, compare = self.__parse_object_property_or_list(next_token)
         return next_token, (items, compare)
 
-    # ---- language commands
-
-    def _parse_command_all(self, next_token, **_):
-        """Parse and evaluate command: `all <list> in <list>`."""
-        next_token, (needle, search) = self.__parse_list_in_list(next_token)
-        for value in needle:
-            if value not in search:
-                value = False
-                break
-        else:
-            value = True
-        return next_token, value
+    def __parse_command(self, next_token, cmdname):
+        """
+        Parse a language command.
 
-    def _parse_command_any(self, next_token, **_):
-        """Parse and evaluate command: `all <list> in <list>`."""
+        grammar:
+            command: ("all" | "any") list_in_list
+        """
+        if cmdname not in ("all", "any"):
+            raise Exception("Unexpected command: `%s`" % cmdname)
         next_token, (needle, search) = self.__parse_list_in_list(next_token)
-        for value in needle:
-            if value in search:
-                value = True
-                break
-        else:
-            value = False
-        return next_token, value
-
-    def _unexpected_command(self, *_args, **params):
-        """Raise an exception due to unexpected command found."""
-        # pylint: disable=no-self-use
-        raise Exception(
-            "Unexpected command: `%s`" % params.get("__command__", "UNKNOWN")
-        )
+        return next_token, (COMMAND, cmdname, needle, search)
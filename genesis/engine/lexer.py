@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Lexical analyzer for the Genesis action language."""
+
+# Token types. Tokens are tuples `(token_type, value)`.
+END = 0
+NAME = 1
+NUMBER = 2
+OP = 3
+
+END_TOKEN = (END, "")
+
+# Operators, grouped by length, so the longest one is always matched.
+OPERATORS = (
+    frozenset(["**=", "//="]),
+    frozenset(["**", "//", "+=", "-=", "*=", "/=", "%="]),
+    frozenset("+-*/%=()[],."),
+)
+
+WHITESPACE = frozenset(" \t\r\n\f\v")
+
+
+def tokenize(source):
+    """
+    Split a Genesis statement or expression into a list of tokens.
+
+    Recognized tokens are numbers, names, the language operators,
+    parentheses, brackets and commas. The list of tokens always ends
+    with `END_TOKEN`.
+    """
+    tokens = []
+    append = tokens.append
+    length = len(source)
+    pos = 0
+    while pos < length:
+        char = source[pos]
+        if char in WHITESPACE:
+            pos += 1
+        elif char.isalpha() or char == "_":
+            end = _scan_name(source, pos + 1, length)
+            append((NAME, source[pos:end]))
+            pos = end
+        elif char.isdigit():
+            end = _scan_number(source, pos + 1, length)
+            append((NUMBER, source[pos:end]))
+            pos = end
+        else:
+            for size, operators in zip((3, 2, 1), OPERATORS):
+                oper = source[pos : pos + size]
+                if oper in operators:
+                    append((OP, oper))
+                    pos += size
+                    break
+            else:
+                raise Exception(
+                    "Invalid character `%s` at position %d." % (char, pos)
+                )
+    append(END_TOKEN)
+    return tokens
+
+
+def _scan_name(source, pos, length):
+    """Retrieve the position of the end of the name starting before pos."""
+    while pos < length and (source[pos].isalnum() or source[pos] == "_"):
+        pos += 1
+    return pos
+
+
+def _scan_number(source, pos, length):
+    """Retrieve the position of the end of the number starting before pos."""
+    while pos < length:
+        char = source[pos]
+        if char.isalnum() or char == "_":
+            pos += 1
+        elif char == "." and pos + 1 < length and source[pos + 1].isdigit():
+            pos += 2
+        else:
+            break
+    return pos
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Genesis language parse tree node kinds."""
+
+# Parse tree nodes are tuples, where the first element is the node kind.
+#   (LITERAL, value)
+#   (IDENTIFIER, qualified_identifier)
+#   (OPERATION, operator, lhs_node, rhs_node)
+#   (COMMAND, command_name, needle_node, search_node)
+#   (LIST, [item, ...])
+#   (STATEMENT, qualified_identifier, None | (operator, expression_node))
+LITERAL = "literal"
+IDENTIFIER = "identifier"
+OPERATION = "operation"
+COMMAND = "command"
+LIST = "list"
+STATEMENT = "statement"
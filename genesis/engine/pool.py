@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Pools of game objects, for reuse."""
+
+
+class ObjectPool:
+    """
+    A bounded pool of released game objects, of a single object template.
+
+    Released objects are kept, up to `maxsize` objects, to be reused by
+    the next spawns of the same template. Pool usage is available through
+    `info()`.
+    """
+
+    def __init__(self, maxsize):
+        """Initialize the pool, holding, at most, `maxsize` objects."""
+        self.maxsize = maxsize
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+        self.__free = []
+
+    def acquire(self):
+        """Retrieve a released object, or None, if the pool is empty."""
+        if not self.__free:
+            self.created += 1
+            return None
+        self.reused += 1
+        return self.__free.pop()
+
+    def release(self, obj):
+        """Return an object to the pool, discarding it if it is full."""
+        if len(self.__free) < self.maxsize:
+            self.released += 1
+            self.__free.append(obj)
+        else:
+            self.discarded += 1
+
+    def __len__(self):
+        """Retrieve the number of objects available for reuse."""
+        return len(self.__free)
+
+    @property
+    def reuse_rate(self):
+        """Retrieve the fraction of spawns that reused a pooled object."""
+        spawns = self.created + self.reused
+        return self.reused / spawns if spawns else 0.0
+
+    def info(self):
+        """Retrieve pool statistics."""
+        return {
+            "size": len(self.__free),
+            "maxsize": self.maxsize,
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "reuse_rate": self.reuse_rate,
+        }
@@ -25,6 +25,17 @@ import pygame  # pylint: disable=import-error
 class Screen:
     """Class screen."""
 
+    # Properties that never change while the game runs, and might be
+    # evaluated only once, when used in object parameters.
+    constant_properties = (
+        "name",
+        "dimension",
+        "width",
+        "height",
+        "center",
+        "client_area",
+    )
+
     def __init__(self, **options):
         """
         Initialize Screen object.
@@ -27,3 +27,16 @@ class ClassNotFoundError(Exception):
         """Initinialize the exception."""
         Exception.__init__(self, "Class not found: `%s`" % classname)
         self.classname = classname
+
+
+class ScriptError(Exception):
+    """Exception raised when a game script has errors."""
+
+    def __init__(self, errors):
+        """Initialize the exception with the list of errors found."""
+        Exception.__init__(
+            self,
+            "Invalid game script:\n%s"
+            % "\n".join("  - %s" % error for error in errors),
+        )
+        self.errors = list(errors)
@@ -19,4 +19,9 @@
 
 """Initialize genesis.object module."""
 
-from genesis.objects.gameobject import GameObject  # noqa: F401
+from genesis.objects.gameobject import (  # noqa: F401
+    GameObject,
+    create_object_class,
+    modifies_result_of,
+    runs_after,
+)
@@ -25,9 +25,64 @@ from genesis.engine.events import EventPublisher
 
 logger = logging.getLogger("genesis_gds")
 
+# Kinds of method hooks.
+_MODIFY_RESULT = "modify result"
+_RUN_AFTER = "run after"
+
+
+def modifies_result_of(method_name):
+    """
+    Declare a behavior method as a hook that modifies a method result.
+
+    The result of the method `method_name`, which must be a tuple, is
+    passed as the positional arguments of the decorated method, and the
+    decorated method result is used as the method result.
+    """
+
+    def decorator(hook):
+        hook.genesis_hook = (_MODIFY_RESULT, method_name)
+        return hook
+
+    return decorator
+
+
+def runs_after(method_name):
+    """
+    Declare a behavior method as a hook that runs after another method.
+
+    The decorated method is called with the same arguments of the method
+    `method_name`, after it returns. The method result is not changed.
+    """
+
+    def decorator(hook):
+        hook.genesis_hook = (_RUN_AFTER, method_name)
+        return hook
+
+    return decorator
+
 
 class GameObject(EventPublisher):
-    """Base class of all game objects."""
+    """
+    Base class of all game objects.
+
+    Game objects and behaviors do not have instance attributes of their
+    own, they define `__slots__ = ()`, and declare the attributes they use
+    in `_fields`. Private names (`__name`) are mangled with the name of the
+    class declaring them. The class created for an object template, with
+    `create_object_class()`, has a slot for every field of its behaviors,
+    so objects do not need a `__dict__`.
+
+    Behaviors might extend methods of other behaviors with hooks, declared
+    with the `modifies_result_of()` and `runs_after()` decorators.
+
+    Objects might be reused after they are destroyed. A reused object is
+    reset with the `reset()` method of each behavior, or, if a behavior
+    does not define one, with its initializer.
+    """
+
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+    _fields = ("__name", "__game")
 
     def __init__(self, **options):
         """Initialize basic object sructure."""
@@ -37,44 +92,47 @@ class GameObject(EventPublisher):
         self.__name = options["name"]
         self.__game = options["game"]
 
-    def modify_result_of(self, actual, method):
-        """Allow a method to process and modify the result of another one."""
-
-        def wrapped(*args, **kwargs):
-            return method(*actual(*args, **kwargs))
+    def reset(self, **_options):
+        """Reset the object for reuse, keeping its event subscriptions."""
 
-        setattr(self, actual.__name__, wrapped)
+    def geometry_changed(self):
+        """
+        Notify that the geometry of the object changed.
 
-    def run_after(self, actual, method):
-        """Allow a method to automatically run after another one."""
-
-        def wrapped(*args, **kwargs):
-            result = actual(*args, **kwargs)
-            method(*args, **kwargs)
-            return result
+        Behaviors that cache values derived from the object geometry, like
+        its bounds, extend this method with `runs_after()`, to discard the
+        cached values. Behaviors that change the geometry, like moving the
+        object, or changing its size, must call it.
+        """
 
-        setattr(self, actual.__name__, wrapped)
+    def destroy(self, **_):
+        """Remove the object from the game, at the end of the frame."""
+        self.__game.despawn(self)
 
     def _extract_list_values(self, values):
+        """
+        Evaluate a value, or a list of values.
+
+        Numbers are used as they are, any other value is evaluated as an
+        expression.
+        """
         if isinstance(values, (list, tuple)):
-            values = list(
-                map(
-                    # pylint: disable=no-member
-                    # All behaviors are used by game objects that have
-                    # the game attribute..
-                    self.game.interpreter.evaluate_expression,
-                    map(str, values),
-                )
-            )
+            values = [self.__extract_value(value) for value in values]
         elif isinstance(values, str):
-            # pylint: disable=no-member
-            # All behaviors are used by game objects that have
-            # the game attribute..
-            values = self.game.interpreter.evaluate_expression(values)
+            values = self.__extract_value(values)
         else:
             raise Exception("List should be lists...")  # FIXME: better message
         return values
 
+    def __extract_value(self, value):
+        """Evaluate a single value, if it is not already a number."""
+        if isinstance(value, (int, float)):
+            return value
+        # pylint: disable=no-member
+        # All behaviors are used by game objects that have
+        # the game attribute..
+        return self.game.interpreter.evaluate_expression(str(value))
+
     @property
     def name(self):
         """Retrieve object name."""
@@ -84,3 +142,111 @@ class GameObject(EventPublisher):
     def game(self):
         """Retrieve the object game."""
         return self.__game
+
+
+def create_object_class(name, behaviors):
+    """
+    Create the class for the objects of a game object template.
+
+    The class inherits from all `behaviors` classes, and its initializer
+    calls the initializer of each behavior, in order, with the options
+    used to create the object. The class `reset()` method resets every
+    behavior, in the same order. The class has a slot for each field
+    declared by the behaviors, and the behaviors hooks are composed with
+    the methods they extend, in the order the behaviors are given. The
+    class should be created only once for each template, and reused for
+    every object spawned from it.
+    """
+    initializers = tuple(behavior.__init__ for behavior in behaviors)
+    resetters = tuple(
+        behavior.__dict__.get("reset", behavior.__init__)
+        for behavior in behaviors
+    )
+    bases = tuple(behaviors)
+    mro = type(name, bases, {}).__mro__
+    namespace = _compose_hooks(mro)
+    namespace["__slots__"] = _collect_fields(mro)
+
+    def __init__(self, **options):
+        for initializer in initializers:
+            initializer(self, **options)
+
+    def reset(self, **options):
+        for resetter in resetters:
+            resetter(self, **options)
+
+    namespace["__init__"] = __init__
+    namespace["reset"] = reset
+    return type(name, bases, namespace)
+
+
+def _collect_fields(classes):
+    """Retrieve the fields declared by classes, with mangled names."""
+    fields = []
+    for cls in reversed(classes):
+        for field in cls.__dict__.get("_fields", ()):
+            if field.startswith("__"):
+                field = "_%s%s" % (cls.__name__.lstrip("_"), field)
+            if field not in fields:
+                fields.append(field)
+    return tuple(fields)
+
+
+def _compose_hooks(mro):
+    """
+    Compose the hooks declared by classes with the methods they extend.
+
+    Returns a dict with a single method for each extended method.
+    """
+    hooks = {}
+    for cls in mro[1:]:
+        for hook in cls.__dict__.values():
+            kind, method_name = getattr(hook, "genesis_hook", (None, None))
+            if kind is not None:
+                modifiers, followers = hooks.setdefault(method_name, ([], []))
+                if kind == _MODIFY_RESULT:
+                    modifiers.append(hook)
+                else:
+                    followers.append(hook)
+    methods = {}
+    for method_name, (modifiers, followers) in hooks.items():
+        method = getattr(mro[0], method_name, None)
+        if not callable(method):
+            raise TypeError("Cannot extend method: `%s`" % method_name)
+        methods[method_name] = _compose_method(method, modifiers, followers)
+    return methods
+
+
+def _compose_method(method, modifiers, followers):
+    """
+    Create a method calling `method`, and the hooks extending it.
+
+    The `modifiers` are applied to the method result, in order, and then
+    the `followers` are called with the method arguments.
+    """
+    if len(modifiers) == 1 and not followers:
+        modifier = modifiers[0]
+
+        def modified(self, *args, **kwargs):
+            return modifier(self, *method(self, *args, **kwargs))
+
+        return modified
+    if len(followers) == 1 and not modifiers:
+        follower = followers[0]
+
+        def followed(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            follower(self, *args, **kwargs)
+            return result
+
+        return followed
+
+    def composed(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        for modifier in modifiers:
+            result = modifier(self, *result)
+        for follower in followers:
+            follower(self, *args, **kwargs)
+        return result
+
+    return composed
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Test that every broadphase selects the same pairs of objects."""
+
+import random
+
+import pytest
+
+from genesis.engine.broadphase import (
+    ALL_LAYERS,
+    AllPairs,
+    SpatialHash,
+    SweepAndPrune,
+)
+
+FRAMES = 20
+
+
+class Item:
+    """An object in a broadphase, with a bounding box."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, order, box, layer=ALL_LAYERS, mask=ALL_LAYERS):
+        """Initialize the object order, bounding box and layers."""
+        self.order = order
+        self.box = box
+        self.layer = layer
+        self.mask = mask
+
+    def __repr__(self):
+        """Represent the object by its order."""
+        return "Item(%d)" % self.order
+
+
+def random_box(rng):
+    """Create a random bounding box, of mixed sizes."""
+    x, y = rng.uniform(0, 500), rng.uniform(0, 500)  # pylint: disable=C0103
+    width, height = rng.uniform(1, 60), rng.uniform(1, 60)
+    return (x, y, x + width, y + height)
+
+
+def move(rng, box):
+    """Move a bounding box a little, or, sometimes, far away."""
+    if rng.random() < 0.05:
+        return random_box(rng)
+    delta_x, delta_y = rng.uniform(-8, 8), rng.uniform(-8, 8)
+    return (
+        box[0] + delta_x,
+        box[1] + delta_y,
+        box[2] + delta_x,
+        box[3] + delta_y,
+    )
+
+
+def overlap(first, second):
+    """Check if the bounding boxes of two objects overlap."""
+    if first.box is None or second.box is None:
+        return True
+    return (
+        first.box[2] >= second.box[0]
+        and second.box[2] >= first.box[0]
+        and first.box[3] >= second.box[1]
+        and second.box[3] >= first.box[1]
+    )
+
+
+def overlapping(pairs):
+    """Retrieve the pairs of objects whose bounding boxes overlap."""
+    return [(obj, other) for obj, other in pairs if overlap(obj, other)]
+
+
+class Scene:
+    """
+    Objects moving in all broadphases, inserted and removed at random.
+
+    If `layers` is given, objects are in random layers, and collide with
+    random layers, from the bits in `(layers, masks)`.
+    """
+
+    def __init__(self, seed, cell_size, count=120, layers=None):
+        """Insert `count` objects, two of them without bounding boxes."""
+        self.rng = random.Random(seed)
+        self.layers = layers
+        self.broadphases = (
+            SpatialHash(cell_size),
+            SweepAndPrune(),
+            AllPairs(),
+        )
+        self.items = []
+        self.added = 0
+        for _ in range(count):
+            self.insert()
+        self.items[7].box = None
+        self.items[90].box = None
+        self.update()
+
+    def insert(self):
+        """Insert an object, in a random position."""
+        item = Item(self.added, random_box(self.rng))
+        if self.layers is not None:
+            item.layer = self.rng.randint(1, self.layers[0])
+            item.mask = self.rng.randint(0, self.layers[1])
+        self.added += 1
+        self.items.append(item)
+        for broadphase in self.broadphases:
+            broadphase.insert(
+                item, item.order, item.box, item.layer, item.mask
+            )
+
+    def remove(self):
+        """Remove a random object."""
+        item = self.rng.choice(self.items)
+        self.items.remove(item)
+        for broadphase in self.broadphases:
+            broadphase.remove(item)
+
+    def update(self):
+        """Update the objects in all broadphases."""
+        for broadphase in self.broadphases:
+            broadphase.update(self.items, lambda item: item.box)
+
+    def step(self):
+        """Move every object, and replace some of them."""
+        for item in self.items:
+            if item.box is not None:
+                item.box = move(self.rng, item.box)
+        self.update()
+        for _ in range(3):
+            self.remove()
+            self.insert()
+
+    @staticmethod
+    def compatible(obj, other):
+        """Check if the layers of two objects allow them to collide."""
+        return bool(obj.layer & other.mask and other.layer & obj.mask)
+
+    def all_pairs(self):
+        """Retrieve every pair of objects, ignoring their layers."""
+        items = sorted(self.items, key=lambda item: item.order)
+        return [
+            (obj, other)
+            for position, obj in enumerate(items)
+            for other in items[position + 1 :]
+        ]
+
+    def pairs(self):
+        """Retrieve the pairs selected by each broadphase."""
+        return [broadphase.pairs() for broadphase in self.broadphases]
+
+    def query(self, probe):
+        """Retrieve the objects selected by each broadphase for a probe."""
+        return [broadphase.query(probe.box) for broadphase in self.broadphases]
+
+
+@pytest.mark.parametrize("seed", (1, 2, 3))
+@pytest.mark.parametrize("cell_size", (16, 64))
+def test_broadphases_select_the_same_pairs(seed, cell_size):
+    """Test the broadphases against all pairs, as objects move."""
+    scene = Scene(seed, cell_size)
+    for _ in range(FRAMES):
+        spatial_hash, sweep_and_prune, all_pairs = scene.pairs()
+        expected = overlapping(all_pairs)
+        assert overlapping(spatial_hash) == expected
+        assert sweep_and_prune == expected
+        scene.step()
+
+
+@pytest.mark.parametrize("seed", (1, 2, 3))
+def test_broadphases_query_the_same_objects(seed):
+    """Test the objects found by the broadphases in a bounding box."""
+    scene = Scene(seed, 32)
+    for _ in range(FRAMES):
+        probe = Item(-1, random_box(scene.rng))
+        found = [
+            [item for item in items if overlap(probe, item)]
+            for items in scene.query(probe)
+        ]
+        assert found[0] == found[1] == found[2]
+        scene.step()
+
+
+BROADPHASES = (SpatialHash, SweepAndPrune, AllPairs)
+
+# (layer and mask of an object, layer and mask of another, if they collide)
+# Each object must be in a layer the other one collides with.
+LAYERS = (
+    ((1, ALL_LAYERS), (1, ALL_LAYERS), True),
+    ((1, 2), (2, 1), True),
+    ((1, 2), (2, 2), False),
+    ((2, 2), (1, 2), False),
+    ((1, 2), (1, 2), False),
+    ((0b101, 0b010), (0b110, 0b100), True),
+    ((1, 0), (1, ALL_LAYERS), False),
+    ((1, ALL_LAYERS), (1, 0), False),
+)
+
+
+@pytest.mark.parametrize("broadphase", BROADPHASES)
+@pytest.mark.parametrize("first, second, collide", LAYERS)
+def test_layers_filter_pairs(broadphase, first, second, collide):
+    """Test that pairs are selected only if their layers are compatible."""
+    index = broadphase()
+    obj, other = Item(0, (0, 0, 10, 10)), Item(1, (5, 5, 15, 15))
+    index.insert(obj, obj.order, obj.box, *first)
+    index.insert(other, other.order, other.box, *second)
+    assert index.pairs() == ([(obj, other)] if collide else [])
+    found = [item for item in index.query(obj.box, *first) if item is other]
+    assert found == ([other] if collide else [])
+    found = [item for item in index.query(other.box, *second) if item is obj]
+    assert found == ([obj] if collide else [])
+
+
+@pytest.mark.parametrize("seed", (1, 2, 3))
+def test_incompatible_layers_are_never_paired(seed):
+    """Test the broadphases with objects in random layers."""
+    scene = Scene(seed, 32, layers=(0b11, 0b11))
+    for _ in range(FRAMES):
+        spatial_hash, sweep_and_prune, all_pairs = scene.pairs()
+        for obj, other in all_pairs:
+            assert scene.compatible(obj, other)
+        expected = overlapping(all_pairs)
+        assert len(expected) < len(overlapping(scene.all_pairs()))
+        assert overlapping(spatial_hash) == expected
+        assert sweep_and_prune == expected
+        scene.step()
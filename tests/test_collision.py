@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Test the collision tests between each pair of bounding shapes."""
+
+from math import cos, pi, radians, sin
+from types import SimpleNamespace
+
+import pytest
+
+from genesis.behavior.collision import Collider, _ellipse_bounds
+
+ELLIPSE, RECT, CIRCLE, LINE, POINT = range(len(Collider.SHAPES))
+
+
+def ellipse(x, y, width, height, rotation=0):
+    """Create the bounds of an ellipse."""
+    # pylint: disable=invalid-name
+    angle = radians(rotation)
+    return (ELLIPSE, [x, y, width, height, rotation, sin(angle), cos(angle)])
+
+
+def rect(x, y, width, height):
+    """Create the bounds of a rectangle."""
+    # pylint: disable=invalid-name
+    return (RECT, [x, y, width, height])
+
+
+def circle(x, y, radius):
+    """Create the bounds of a circle."""
+    # pylint: disable=invalid-name
+    return (CIRCLE, [x, y, radius])
+
+
+def line(x1, y1, x2, y2):
+    """Create the bounds of a line segment."""
+    # pylint: disable=invalid-name
+    return (LINE, [x1, y1, x2, y2])
+
+
+def point(x, y):
+    """Create the bounds of a point."""
+    # pylint: disable=invalid-name
+    return (POINT, [x, y])
+
+
+# (first shape, second shape, contact point, or None if they do not collide)
+# For each pair of shapes, the shapes overlap, touch, and are separated.
+CASES = {
+    "circle-circle": (
+        (circle(0, 0, 10), circle(15, 0, 10), (7.5, 0)),
+        (circle(0, 0, 10), circle(20, 0, 10), (10, 0)),
+        (circle(0, 0, 10), circle(21, 0, 10), None),
+    ),
+    "circle-rect": (
+        (circle(0, 0, 10), rect(5, -5, 10, 10), (5, 0)),
+        (circle(0, 0, 10), rect(10, -5, 10, 10), (10, 0)),
+        (circle(0, 0, 10), rect(11, -5, 10, 10), None),
+    ),
+    "circle-point": (
+        (circle(0, 0, 10), point(5, 0), (5, 0)),
+        (circle(0, 0, 10), point(10, 0), (10, 0)),
+        (circle(0, 0, 10), point(11, 0), None),
+    ),
+    "ellipse-circle": (
+        (ellipse(0, 0, 40, 20), circle(25, 0, 10), (20, 0)),
+        (ellipse(0, 0, 40, 20), circle(30, 0, 10), (20, 0)),
+        (ellipse(0, 0, 40, 20), circle(31, 0, 10), None),
+    ),
+    "ellipse-circle-rotated": (
+        (ellipse(0, 0, 40, 20, 90), circle(0, 25, 10), (0, 20)),
+        (ellipse(0, 0, 40, 20, 90), circle(15, 0, 5), (10, 0)),
+        (ellipse(0, 0, 40, 20, 90), circle(25, 0, 10), None),
+    ),
+    "ellipse-rect": (
+        (ellipse(0, 0, 40, 20), rect(15, -5, 10, 10), (15, 0)),
+        (ellipse(0, 0, 40, 20), rect(20, -5, 10, 10), (20, 0)),
+        (ellipse(0, 0, 40, 20), rect(21, -5, 10, 10), None),
+    ),
+    "ellipse-ellipse": (
+        (ellipse(0, 0, 40, 20), ellipse(35, 0, 40, 20), (15, 0)),
+        (ellipse(0, 0, 40, 20), ellipse(40, 0, 40, 20), (20, 0)),
+        (ellipse(0, 0, 40, 20), ellipse(41, 0, 40, 20), None),
+    ),
+    "ellipse-ellipse-rotated": (
+        (ellipse(0, 0, 40, 20, 90), ellipse(0, 35, 40, 20, 90), (0, 15)),
+        (ellipse(0, 0, 40, 20, 90), ellipse(30, 0, 40, 20), (10, 0)),
+        (ellipse(0, 0, 40, 20, 90), ellipse(31, 0, 40, 20), None),
+    ),
+    "ellipse-line": (
+        (ellipse(0, 0, 40, 20), line(15, -20, 15, 20), (15, 0)),
+        (ellipse(0, 0, 40, 20), line(20, -20, 20, 20), (20, 0)),
+        (ellipse(0, 0, 40, 20), line(21, -20, 21, 20), None),
+    ),
+    "ellipse-point": (
+        (ellipse(0, 0, 40, 20), point(15, 0), (15, 0)),
+        (ellipse(0, 0, 40, 20), point(0, 10), (0, 10)),
+        (ellipse(0, 0, 40, 20), point(0, 11), None),
+    ),
+    "rect-rect": (
+        (rect(0, 0, 10, 10), rect(5, 5, 10, 10), (7.5, 7.5)),
+        (rect(0, 0, 10, 10), rect(10, 0, 10, 10), (10, 5)),
+        (rect(0, 0, 10, 10), rect(11, 0, 10, 10), None),
+    ),
+    "point-rect": (
+        (point(5, 5), rect(0, 0, 10, 10), (5, 5)),
+        (point(10, 5), rect(0, 0, 10, 10), (10, 5)),
+        (point(11, 5), rect(0, 0, 10, 10), None),
+    ),
+    "point-point": (
+        (point(1, 1), point(1, 1), (1, 1)),
+        (point(1, 1), point(1, 1 + 1e-7), (1, 1)),
+        (point(1, 1), point(1, 2), None),
+    ),
+    "line-line": (
+        (line(0, 0, 10, 10), line(0, 10, 10, 0), (5, 5)),
+        (line(0, 0, 10, 0), line(10, 0, 10, 10), (10, 0)),
+        (line(0, 0, 10, 0), line(11, 0, 11, 10), None),
+    ),
+    "line-line-parallel": (
+        (line(0, 0, 10, 0), line(5, 0, 15, 0), (7.5, 0)),
+        (line(0, 0, 10, 0), line(10, 0, 20, 0), (10, 0)),
+        (line(0, 0, 10, 0), line(0, 1, 10, 1), None),
+    ),
+    "line-rect": (
+        (line(-5, 5, 15, 5), rect(0, 0, 10, 10), (0, 5)),
+        (line(-5, 10, 15, 10), rect(0, 0, 10, 10), (0, 10)),
+        (line(-5, 11, 15, 11), rect(0, 0, 10, 10), None),
+    ),
+    "line-circle": (
+        (line(-10, 5, 10, 5), circle(0, 0, 10), (0, 5)),
+        (line(-10, 10, 10, 10), circle(0, 0, 10), (0, 10)),
+        (line(-10, 11, 10, 11), circle(0, 0, 10), None),
+    ),
+    "line-point": (
+        (line(0, 0, 10, 10), point(5, 5), (5, 5)),
+        (line(0, 0, 10, 10), point(10, 10), (10, 10)),
+        (line(0, 0, 10, 10), point(5, 6), None),
+    ),
+}
+
+TABLE = [
+    pytest.param(first, second, contact, id="%s-%s" % (name, case))
+    for name, cases in CASES.items()
+    for case, (first, second, contact) in zip(
+        ("overlap", "touch", "apart"), cases
+    )
+]
+
+
+class Shape:
+    """A collider, with its bounding shape kind and bounds."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, shape):
+        """Initialize the shape kind and bounds."""
+        self.shape_kind, self.bounds = shape
+
+
+def collide(first, second):
+    """Retrieve the contact point and angle of two shapes, or None."""
+    collisions = Collider.detect_collisions([(Shape(first), Shape(second))])
+    if not collisions:
+        return None
+    _, _, contact, angle = collisions[0]
+    return contact, angle
+
+
+@pytest.mark.parametrize("first, second, contact", TABLE)
+def test_shapes_collide(first, second, contact):
+    """Test the collision, and the contact point, of two shapes."""
+    result = collide(first, second)
+    if contact is None:
+        assert result is None
+    else:
+        assert result is not None
+        assert result[0] == pytest.approx(contact, abs=1e-6)
+
+
+@pytest.mark.parametrize("first, second, contact", TABLE)
+def test_collisions_are_symmetric(first, second, contact):
+    """Test that swapping shapes gives the same contact, reversed."""
+    # pylint: disable=arguments-out-of-order
+    result, swapped = collide(first, second), collide(second, first)
+    assert (result is None) == (swapped is None)
+    if contact is not None and first[0] != second[0]:
+        assert swapped[0] == pytest.approx(result[0], abs=1e-6)
+        turn = (swapped[1] - result[1]) % (2 * pi)
+        assert turn == pytest.approx(pi)
+
+
+def test_ellipse_rotation_is_cached():
+    """Test that the sine and cosine are computed when rotation changes."""
+    shape = SimpleNamespace(center=(1, 2), dimension=(40, 20), rotation=30)
+    bounds = [0, 0, 0, 0, 30, "sine", "cosine"]
+    _ellipse_bounds(shape, bounds)
+    assert bounds == [1, 2, 40, 20, 30, "sine", "cosine"]
+    shape.rotation = 90
+    _ellipse_bounds(shape, bounds)
+    assert bounds[4:] == [90, pytest.approx(1), pytest.approx(0)]
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Test games loaded from scripts, stepping frames without drawing."""
+
+import copy
+
+import pytest
+
+from genesis.errors import ScriptError
+from genesis.behavior import collision
+from genesis.engine.events import GameEvent
+from genesis.engine.game import Game
+
+
+def template(name, *behaviors, **attributes):
+    """Create an object template, from `(behavior, parameters)` pairs."""
+    description = {
+        "behaviors": [{behavior: params} for behavior, params in behaviors]
+    }
+    description.update(attributes)
+    return {name: description}
+
+
+def create_game(*templates, **options):
+    """
+    Create a game with the object templates, and a single level.
+
+    The options are the `game.collision` options. The templates are
+    copied, as loading the game changes them.
+    """
+    script = {
+        "interface": {"screen": {"width": 200, "height": 200}},
+        "game": {
+            "collision": options,
+            "objects": copy.deepcopy(list(templates)),
+            "levels": [{"single": [{"start": [{"do": []}]}]}],
+        },
+    }
+    return Game(script, fps=0)
+
+
+def start_game(*templates, **options):
+    """Create a game, load it, and start its single level."""
+    game = create_game(*templates, **options)
+    game.load()
+    level = game.levels[0]
+    level.setup()
+    level.start()
+    return game
+
+
+def test_invalid_behaviors_are_script_errors():
+    """Test that behaviors extending missing methods are reported."""
+    game = create_game(
+        template(
+            "ball",
+            ("Circle", {"radius": 10}),
+            ("LimitMovement", {"limit_area": [0, 0, 200, 200]}),
+        )
+    )
+    with pytest.raises(ScriptError) as error:
+        game.load()
+    assert any(
+        message.startswith("ball: invalid behaviors: Cannot extend method")
+        for message in error.value.errors
+    )
+
+
+BALL = template(
+    "ball",
+    ("Circle", {"radius": 5}),
+    ("Movable", {"position": [0, 0]}),
+)
+
+
+@pytest.mark.parametrize("count", (0, -1, "3"))
+def test_spawn_count_is_validated(count):
+    """Test that objects are spawned only for a positive count."""
+    game = start_game(BALL)
+    with pytest.raises(Exception, match="Invalid count to spawn `ball`"):
+        game.spawn("ball", count=count)
+
+
+def test_grid_columns_are_validated():
+    """Test that grids are generated only for a positive column count."""
+    game = start_game(BALL)
+    with pytest.raises(Exception, match="Invalid `grid` generator"):
+        game.spawn("ball", count=4, position={"grid": {"columns": 0}})
+    balls = game.spawn("ball", count=4, position={"grid": {"columns": 2}})
+    assert [ball.position for ball in balls] == [
+        (0, 0),
+        (1, 0),
+        (0, 1),
+        (1, 1),
+    ]
+
+
+COLLIDER = (
+    ("Circle", {"radius": 10}),
+    ("Movable", {"position": [0, 0]}),
+    ("Collider", {}),
+)
+
+STATIC = ("post", "wall", "fence")
+
+CONTACT_EVENTS = ("collision_enter", "collision_stay", "collision_exit")
+
+
+class Recorder:
+    """An observer recording the events it is notified of."""
+
+    name = "recorder"
+
+    def __init__(self):
+        """Initialize the lists of events."""
+        self.events = []
+        self.contacts = []
+
+    def notify(self, event):
+        """Record the event sender and name, and the objects in contact."""
+        self.events.append((event.sender.name, event.name))
+        self.contacts.append((event.sender.name, *event.against))
+
+    def frame(self, game):
+        """Step a frame, and retrieve the events recorded in it."""
+        game.step()
+        events, self.events = self.events, []
+        return sorted(events)
+
+
+def contact_scene(events=CONTACT_EVENTS):
+    """Create a wall, and a ball far from it, recording their events."""
+    game = start_game(template("wall", *COLLIDER), template("ball", *COLLIDER))
+    wall = game.spawn("wall")
+    ball = game.spawn("ball", position=[100, 0])
+    recorder = Recorder()
+    for obj in (wall, ball):
+        for event in events:
+            obj.subscribe(event, recorder)
+    return game, wall, ball, recorder
+
+
+def test_collision_contact_lifecycle():
+    """Test that contacts enter, stay, and exit as objects move."""
+    game, _, ball, recorder = contact_scene()
+    assert recorder.frame(game) == []
+    ball.move(-85, 0)
+    assert recorder.frame(game) == [
+        ("ball", "collision_enter"),
+        ("wall", "collision_enter"),
+    ]
+    assert recorder.frame(game) == [
+        ("ball", "collision_stay"),
+        ("wall", "collision_stay"),
+    ]
+    ball.move(85, 0)
+    assert recorder.frame(game) == [
+        ("ball", "collision_exit"),
+        ("wall", "collision_exit"),
+    ]
+    assert recorder.frame(game) == []
+
+
+def test_removed_objects_end_contacts():
+    """Test that objects in contact with a removed object exit it."""
+    game, wall, ball, recorder = contact_scene()
+    ball.move(-85, 0)
+    recorder.frame(game)
+    wall.destroy()
+    assert recorder.frame(game) == [
+        ("ball", "collision_exit"),
+        ("ball", "collision_stay"),
+        ("wall", "collision_stay"),
+    ]
+    assert game.find_object("wall") is None
+    assert recorder.frame(game) == []
+
+
+def test_collision_events_are_created_when_observed(monkeypatch):
+    """Test that collision events are only created for observers."""
+    created = []
+
+    def create_event(sender, name, **attributes):
+        created.append((sender.name, name))
+        return GameEvent(sender, name, **attributes)
+
+    monkeypatch.setattr(collision, "GameEvent", create_event)
+    game, _, ball, recorder = contact_scene(events=("collision_exit",))
+    ball.subscribe("collision_enter", recorder)
+    ball.move(-85, 0)
+    game.step()
+    game.step()
+    ball.move(85, 0)
+    game.step()
+    assert sorted(created) == [
+        ("ball", "collision_enter"),
+        ("ball", "collision_exit"),
+        ("wall", "collision_exit"),
+    ]
+    assert sorted(recorder.events) == sorted(created)
+
+
+def test_pooled_objects_are_reset_and_reused():
+    """Test that despawned objects are reset when spawned again."""
+    game = start_game(template("ball", *COLLIDER, pool=2))
+    ball = game.spawn("ball", position=[5, 5], radius=3)
+    ball.destroy()
+    game.step()
+    assert game.find_object("ball") is None
+    reused = game.spawn("ball", position=[50, 60])
+    assert reused is ball
+    assert (reused.position, reused.radius) == ((50, 60), 10)
+    assert reused.bounding_box == (50, 60, 70, 80)
+    assert game.find_objects("ball") == [reused]
+
+
+def test_pool_info_counts():
+    """Test the statistics of object pools."""
+    game = start_game(template("ball", *COLLIDER, pool=1))
+    balls = game.spawn("ball", count=3)
+    for ball in balls + balls[:1]:
+        ball.destroy()
+    game.step()
+    info = game.pool_info()["ball"]
+    assert (info["created"], info["released"], info["discarded"]) == (3, 1, 2)
+    assert info["size"] == 1
+    game.spawn("ball", count=2)
+    info = game.pool_info()["ball"]
+    assert (info["created"], info["reused"], info["size"]) == (4, 1, 0)
+    assert info["reuse_rate"] == pytest.approx(1 / 5)
+
+
+def test_objects_destroyed_while_updated():
+    """Test that objects destroyed by event handlers finish the frame."""
+    game = start_game(
+        template(
+            "ball",
+            ("Circle", {"radius": 1}),
+            ("LinearMove", {"speed": 10, "angle": 0}),
+            (
+                "LimitMovement",
+                {
+                    "limit_area": [0, 0, 100, 100],
+                    "events": [{"offlimits": [{"do": ["destroy"]}]}],
+                },
+            ),
+            ("Collider", {}),
+            pool=4,
+        ),
+    )
+    balls = [game.spawn("ball", position=[x, 50]) for x in (95, 50, 95, 50)]
+    game.step()
+    assert [ball.position for ball in balls] == [
+        (100, 50),
+        (60, 50),
+        (100, 50),
+        (60, 50),
+    ]
+    assert game.find_objects("ball") == balls[1::2]
+    assert game.updatable_objects[-2:] == balls[1::2]
+    assert game.pool_info()["ball"]["released"] == 2
+
+
+@pytest.mark.parametrize("option", ("layer", "mask"))
+@pytest.mark.parametrize("value", (True, False, 1.0, "1", None))
+def test_collision_layers_are_integers(option, value):
+    """Test that collision layers and masks must be integer bits."""
+    game = start_game(template("ball", *COLLIDER))
+    with pytest.raises(Exception, match="Invalid collision layer bits"):
+        game.spawn("ball", **{option: value})
+
+
+def test_objects_collide_with_compatible_layers():
+    """Test that contacts are only made by objects with compatible layers."""
+    game = start_game(template("wall", *COLLIDER), template("ball", *COLLIDER))
+    wall = game.spawn("wall", layer=0b01, mask=0b10)
+    balls = [
+        game.spawn("ball", position=[5, 0], layer=layer, mask=mask)
+        for layer, mask in ((0b10, 0b01), (0b10, 0b10), (0b01, 0b01))
+    ]
+    recorders = [Recorder() for _ in range(4)]
+    for obj, recorder in zip([wall] + balls, recorders):
+        obj.subscribe("collision_enter", recorder)
+    game.step()
+    assert [recorder.events for recorder in recorders] == [
+        [("wall", "collision_enter")],
+        [("ball", "collision_enter")],
+        [],
+        [],
+    ]
+
+
+def test_static_objects_collide_with_dynamic_objects():
+    """Test that static objects only collide with objects that move."""
+    static = ("Collider", {"static": True})
+    game = create_game(
+        *[template(name, *COLLIDER[:2], static) for name in STATIC],
+        template("ball", *COLLIDER),
+    )
+    game.load()
+    level = game.levels[0]
+    statics = [game.spawn(name) for name in STATIC[:2]]
+    level.setup()
+    level.start()
+    statics.append(game.spawn(STATIC[2]))
+    ball = game.spawn("ball", position=[5, 0])
+    recorder = Recorder()
+    for obj in statics + [ball]:
+        obj.subscribe("collision_enter", recorder)
+    game.step()
+    assert sorted(recorder.contacts) == sorted(
+        [("ball", name) for name in STATIC]
+        + [(name, "ball") for name in STATIC]
+    )
+    assert [
+        against for sender, against in recorder.contacts if sender == "ball"
+    ] == list(STATIC)
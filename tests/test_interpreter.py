@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Genesis project.
+#
+# Copyright (C) 2020 Rafael Guterres Jeffman
+#
+# Genesis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Foobar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more detail, frame=Nos.
+#
+# You should have received a copy of the GNU General Public License
+# along with Foobar.  If not, see <ht | pygame.HWSURFACEicenses/>.
+
+"""Compare the compiled and the reference interpreter back ends."""
+
+import pytest
+
+from genesis.engine.interpreter import GenesisIntepreter
+
+MODES = (GenesisIntepreter.COMPILED, GenesisIntepreter.REFERENCE)
+
+EXPRESSIONS = (
+    # arithmetic
+    "1 + 2 * 3",
+    "(1 + 2) * 3",
+    "2 ** 10",
+    "7 / 2",
+    "7 // 2",
+    "7 % 3",
+    "10 - 4 - 3",
+    # comparisons
+    "any (top, bottom) in limits",
+    "any (left, right) in limits",
+    "all (top, left) in limits",
+    "all (top, bottom) in limits",
+    # member access
+    "screen.width - 50",
+    "screen.width / screen.height",
+    "ball.radius * 2",
+    "event.amount + 1",
+    # calls
+    "double",
+    "self.double + 1",
+    "game_level",
+    # errors
+    "unknown + 1",
+    "self.speed",
+    "screen.width / 0",
+)
+
+STATEMENTS = (
+    "speed = 5",
+    "speed += event.amount",
+    "self.speed *= 2",
+    "speed -= ball.radius",
+    "speed //= 3",
+    "speed **= 2",
+    "speed = screen.width % 7",
+    "double",
+    "self.double",
+    "missing = 1",
+)
+
+
+class Entity:
+    """A game object, with arbitrary attributes."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, name, **attributes):
+        """Initialize the object attributes."""
+        self.name = name
+        self.__dict__.update(attributes)
+
+
+class Caller(Entity):
+    """The object executing the statements."""
+
+    # pylint: disable=too-few-public-methods
+
+    def double(self, **_):
+        """Retrieve twice the object speed."""
+        return 2 * self.speed  # pylint: disable=no-member
+
+
+class FakeGame:
+    """The game queried by the interpreter."""
+
+    names_version = 0
+
+    def __init__(self):
+        """Initialize the game objects."""
+        self.objects = {
+            "screen": Entity("screen", width=600, height=400),
+            "ball": Entity("ball", radius=25),
+        }
+
+    def find_object(self, name):
+        """Retrieve an object, or None."""
+        return self.objects.get(name)
+
+    def get_object(self, name):
+        """Retrieve an object."""
+        return self.objects[name]
+
+    @staticmethod
+    def game_level(**_):
+        """Retrieve the current level."""
+        return 3
+
+
+def scope(caller):
+    """Create the scope for an execution by caller."""
+    return {
+        "caller": caller,
+        "name": caller.name,
+        "limits": ["top", "right"],
+        "event": {"amount": 4},
+    }
+
+
+def outcome(action):
+    """Retrieve the result of an action, or the exception it raised."""
+    try:
+        return ("result", action())
+    except Exception as error:  # pylint: disable=broad-except
+        return ("error", type(error), str(error))
+
+
+def run_expression(mode, source):
+    """Evaluate an expression with an interpreter in `mode`."""
+    game = FakeGame()
+    caller = Caller("player", speed=10)
+    interpreter = GenesisIntepreter(game, mode=mode)
+    return outcome(
+        lambda: interpreter.evaluate(
+            interpreter.compile_expression(source), scope(caller)
+        )
+    )
+
+
+def run_statement(mode, source):
+    """Execute a statement with an interpreter in `mode`."""
+    game = FakeGame()
+    caller = Caller("player", speed=10)
+    interpreter = GenesisIntepreter(game, mode=mode)
+    result = outcome(
+        lambda: interpreter.run_statement(
+            interpreter.compile_statement(source), scope(caller)
+        )
+    )
+    return result, vars(caller)
+
+
+@pytest.mark.parametrize("source", EXPRESSIONS)
+def test_expression_backends_agree(source):
+    """Test that both back ends evaluate expressions to the same value."""
+    compiled, reference = [run_expression(mode, source) for mode in MODES]
+    assert compiled == reference
+
+
+@pytest.mark.parametrize("source", STATEMENTS)
+def test_statement_backends_agree(source):
+    """Test that both back ends execute statements with the same effect."""
+    compiled, reference = [run_statement(mode, source) for mode in MODES]
+    assert compiled == reference
+
+
+def test_mode_is_read_only():
+    """Test that the mode cannot change after compiled code is cached."""
+    interpreter = GenesisIntepreter(FakeGame())
+    with pytest.raises(AttributeError):
+        interpreter.mode = GenesisIntepreter.REFERENCE
+
+
+def test_binding_follows_name_index():
+    """Test that global objects are resolved again when names change."""
+    game = FakeGame()
+    caller = Caller("player", speed=10)
+    interpreter = GenesisIntepreter(game)
+    compiled = interpreter.compile_expression("paddle.width + 1")
+    context = scope(caller)
+    context["paddle"] = {"width": 1}
+    assert interpreter.evaluate(compiled, context) == 2
+    game.objects["paddle"] = Entity("paddle", width=100)
+    game.names_version += 1
+    assert interpreter.evaluate(compiled, context) == 101
+    del game.objects["paddle"]
+    game.names_version += 1
+    assert interpreter.evaluate(compiled, context) == 2